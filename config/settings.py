@@ -2,8 +2,9 @@
 import os
 import sys
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 
 def get_base_path() -> Path:
@@ -40,6 +41,30 @@ APP_SETTINGS: Dict[str, Any] = {
     "log_format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 }
 
+
+@dataclass(frozen=True, slots=True)
+class AppSettings:
+    """UIで頻繁に参照するアプリケーション設定（読み取り専用）"""
+
+    max_players: int
+    min_players: int
+    default_window_size: Dict[str, Tuple[int, int]]
+
+    def __post_init__(self):
+        """設定値の検証"""
+        if not 0 < self.min_players <= self.max_players:
+            raise ValueError(
+                f"Invalid player limits: min={self.min_players}, max={self.max_players}"
+            )
+
+
+# APP_SETTINGS から作成した属性アクセス用の設定
+APP = AppSettings(
+    max_players=APP_SETTINGS["max_players"],
+    min_players=APP_SETTINGS["min_players"],
+    default_window_size=APP_SETTINGS["default_window_size"],
+)
+
 # 役職設定
 ROLE_SETTINGS = {
     "villager": {
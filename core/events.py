@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from enum import Enum
 from typing import Dict, Any, Optional, List, Callable
 from dataclasses import dataclass, field
@@ -6,6 +7,13 @@ import logging
 import json
 
 
+def _json_default(obj: Any) -> Any:
+    """JSONに変換できない値の変換（遅延評価のマッピングなどに対応）"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
 class EventType(Enum):
     """イベントタイプの列挙型定義"""
 
@@ -145,10 +153,12 @@ class EventManager:
             self._add_to_history(event)
             self.logger.info(f"Event notified: {event}")
 
-            # DEBUGレベルで詳細なイベントデータをログ出力
-            self.logger.debug(
-                f"Event details: {json.dumps(event.to_dict(), ensure_ascii=False)}"
-            )
+            # DEBUGレベルで詳細なイベントデータをログ出力（無効時はシリアライズしない）
+            if self.logger.isEnabledFor(logging.DEBUG):
+                details = json.dumps(
+                    event.to_dict(), ensure_ascii=False, default=_json_default
+                )
+                self.logger.debug(f"Event details: {details}")
 
             for callback in self._observers[event.type]:
                 try:
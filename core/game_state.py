@@ -66,6 +66,9 @@ class GameState:
         self.regulation: Optional[Dict] = None
         self.game_active: bool = False
 
+        # プレイヤー構成・生死が変わるたびに増える更新番号（キャッシュの無効化用）
+        self.version: int = 0
+
         # 確定状態
         self.is_regulation_confirmed: bool = False
         self.is_players_confirmed: bool = False
@@ -85,6 +88,7 @@ class GameState:
             self.players[player.name] = player
             if player.is_alive:
                 self.alive_players.add(player.name)
+            self.version += 1
 
             self.is_players_confirmed = False
 
@@ -113,6 +117,7 @@ class GameState:
             player = self.players[player_name]
             del self.players[player_name]
             self.alive_players.discard(player_name)
+            self.version += 1
 
             event_manager.notify(
                 GameEvent(
@@ -146,6 +151,7 @@ class GameState:
 
             player.kill()
             self.alive_players.remove(player_name)
+            self.version += 1
 
             event_manager.notify(
                 GameEvent(
@@ -275,6 +281,7 @@ class GameState:
                 raise ValueError("Cannot start: Player count does not match regulation")
 
             self.alive_players = set(self.players.keys())
+            self.version += 1
             self.current_round = 1
             self.current_phase = GamePhase.DAY_DISCUSSION
             self.game_active = True
@@ -349,6 +356,7 @@ class GameState:
 
             # 生存プレイヤーリストをクリア
             self.alive_players.clear()
+            self.version += 1
 
             # レギュレーションをクリア
             self.regulation = None
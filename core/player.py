@@ -40,7 +40,7 @@ class PlayerStatus:
     reason: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """プレイヤーを表すクラス"""
 
@@ -1,6 +1,8 @@
-from typing import Dict, Any, Optional, Set, List, Callable
+from typing import Dict, Any, Optional, Set, List, Callable, Tuple
+import bisect
 import json
 import logging
+import os
 from pathlib import Path
 from config.settings import DATA_DIR
 from core.game_state import GameState, GamePhase
@@ -37,6 +39,10 @@ class GlobalDataStore:
         # ゲームログ
         self.game_log = []
 
+        # 保存済みレギュレーションのキャッシュ（ファイル更新時刻, 内容）
+        self._regulations_cache: Optional[Tuple[float, Dict]] = None
+        self._regulation_names: List[str] = []  # キャッシュ内の名前（名前順）
+
         # オブザーバー管理
         self._observers: List[Callable[[str], None]] = []
 
@@ -153,6 +159,7 @@ class GlobalDataStore:
         """プレイヤー情報の設定"""
         self.game_state.players.clear()
         self.game_state.alive_players.clear()
+        self.game_state.version += 1
 
         for player in players:
             self.game_state.add_player(player)
@@ -212,15 +219,31 @@ class GlobalDataStore:
 
             file_path = DATA_DIR / "sample_regulations.json"
             regulations = {}
+            cache_valid = False
 
             if file_path.exists():
+                cache_valid = (
+                    self._regulations_cache is not None
+                    and self._regulations_cache[0] == file_path.stat().st_mtime
+                )
                 with open(file_path, "r", encoding="utf-8") as f:
                     regulations = json.load(f)
 
+            is_new = name not in regulations
             regulations[name] = regulation_data
 
-            with open(file_path, "w", encoding="utf-8") as f:
+            # 書き込み途中で中断されても既存のファイルを壊さないよう置き換えで保存
+            tmp_path = file_path.with_name(file_path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(regulations, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, file_path)
+
+            # 名前一覧はキャッシュが最新なら挿入のみで更新する
+            if not cache_valid:
+                self._regulation_names = sorted(regulations)
+            elif is_new:
+                bisect.insort(self._regulation_names, name)
+            self._regulations_cache = (file_path.stat().st_mtime, regulations)
 
             event_manager.notify(
                 GameEvent(
@@ -240,14 +263,31 @@ class GlobalDataStore:
         """保存済みレギュレーションの読み込み"""
         try:
             file_path = DATA_DIR / "sample_regulations.json"
-            if file_path.exists():
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            return {}
+            if not file_path.exists():
+                return {}
+
+            # ファイルが更新されていなければキャッシュを返す
+            mtime = file_path.stat().st_mtime
+            if self._regulations_cache and self._regulations_cache[0] == mtime:
+                self.logger.debug("Regulations cache hit")
+                return self._regulations_cache[1]
+
+            self.logger.debug("Regulations cache miss")
+            with open(file_path, "r", encoding="utf-8") as f:
+                regulations = json.load(f)
+            self._regulations_cache = (mtime, regulations)
+            self._regulation_names = sorted(regulations)
+            return regulations
         except Exception as e:
             self.logger.error(f"Error loading regulations: {str(e)}")
             return {}
 
+    def regulation_names(self) -> List[str]:
+        """保存済みレギュレーション名の一覧（名前順のコピー）"""
+        if not self.load_regulations():
+            return []
+        return list(self._regulation_names)
+
     def _validate_regulation(self, regulation: Dict) -> bool:
         """レギュレーションデータの検証"""
         try:
@@ -1,15 +1,21 @@
 import os
 import sys
+import tempfile
+from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import tkinter as tk
 import unittest
 from unittest.mock import Mock, patch
 from core.game_state import GameState, GamePhase, Team
 from core.player import Player, PlayerRole
-from core.events import EventType, GameEvent, event_manager
+from core.events import EventType, EventManager, GameEvent, event_manager
 from store.global_data_store import GlobalDataStore
 from config.regulation import Regulation
+from config.settings import ROLE_SETTINGS
+from utils.validators import validate_player_data, validate_game_state
+from ui.regulation_setting import RegulationSettingWindow, RegulationState
 
 
 class TestGameState(unittest.TestCase):
@@ -67,6 +73,20 @@ class TestGameState(unittest.TestCase):
         self.assertNotIn("test_player", self.game_state.players)
         self.assertNotIn("test_player", self.game_state.alive_players)
 
+    def test_version_counter(self):
+        """更新番号のテスト"""
+        version = self.game_state.version
+        player = Player(number=1, name="test_player")
+        self.game_state.add_player(player)
+        self.assertEqual(self.game_state.version, version + 1)
+
+        # 変化のない操作では増えない
+        self.game_state.add_player(player)
+        self.assertEqual(self.game_state.version, version + 1)
+
+        self.game_state.remove_player("test_player")
+        self.assertEqual(self.game_state.version, version + 2)
+
     def test_phase_transition(self):
         """フェーズ遷移のテスト"""
         player = Player(number=1, name="test_player")
@@ -188,6 +208,9 @@ class TestGlobalDataStore(unittest.TestCase):
         """各テストの後に実行される"""
         self.store.game_log = []
         self.store.game_state = GameState()
+        # 一時ディレクトリから読み込んだレギュレーションのキャッシュを破棄
+        self.store._regulations_cache = None
+        self.store._regulation_names = []
 
     def test_singleton(self):
         """シングルトンパターンのテスト"""
@@ -210,6 +233,32 @@ class TestGlobalDataStore(unittest.TestCase):
         invalid_regulation = {"roles": {"invalid_role": 1}}
         self.assertFalse(self.store._validate_regulation(invalid_regulation))
 
+    def test_load_regulations_cache(self):
+        """保存済みレギュレーションのキャッシュのテスト"""
+        regulation = {
+            "roles": {"villager": 3, "werewolf": 1},
+            "round_times": [{"round": 1, "time": 5}],
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch("store.global_data_store.DATA_DIR", Path(tmp_dir)):
+                self.store._regulations_cache = None
+                self.assertTrue(self.store.save_regulation("test", regulation))
+
+                loaded = self.store.load_regulations()
+                self.assertEqual(loaded, {"test": regulation})
+                # 更新がなければ同じ内容を再利用する
+                self.assertIs(self.store.load_regulations(), loaded)
+
+                # 保存した内容がキャッシュと名前一覧に反映される
+                self.store.save_regulation("b", regulation)
+                self.store.save_regulation("a", regulation)
+                self.assertIn("b", self.store.load_regulations())
+                self.assertEqual(self.store.regulation_names(), ["a", "b", "test"])
+
+                # 返された一覧を変更してもキャッシュには影響しない
+                self.store.regulation_names().append("0")
+                self.assertEqual(self.store.regulation_names(), ["a", "b", "test"])
+
     def test_game_log(self):
         """ゲームログのテスト"""
         log_entry = {
@@ -268,6 +317,26 @@ class TestGlobalDataStore(unittest.TestCase):
             self.fail(f"Test failed with error: {str(e)}")
 
 
+class TestEventManager(unittest.TestCase):
+    def setUp(self):
+        """各テストの前に実行される（共有インスタンスは使わない）"""
+        self.manager = EventManager()
+        self.manager.logger = Mock()
+
+    @patch("core.events.json")
+    def test_notify_serializes_only_for_debug(self, mock_json):
+        """イベント詳細のシリアライズのテスト"""
+        event = GameEvent(type=EventType.VOTING_COMPLETED, data={"vote_results": {}})
+
+        self.manager.logger.isEnabledFor.return_value = False
+        self.manager.notify(event)
+        mock_json.dumps.assert_not_called()
+
+        self.manager.logger.isEnabledFor.return_value = True
+        self.manager.notify(event)
+        mock_json.dumps.assert_called_once()
+
+
 class TestPlayer(unittest.TestCase):
     def setUp(self):
         self.player = Player(number=1, name="test_player")
@@ -291,5 +360,85 @@ class TestPlayer(unittest.TestCase):
         self.assertEqual(player.role, PlayerRole.VILLAGER)
 
 
+class TestValidators(unittest.TestCase):
+    def test_validate_player_data(self):
+        """プレイヤーデータ検証のテスト"""
+        player = Player(number=1, name="test_player")
+        self.assertTrue(validate_player_data(player))
+
+        player.name = " "
+        self.assertFalse(validate_player_data(player))
+
+    def test_validate_game_state(self):
+        """ゲーム状態検証のテスト"""
+        game_state = GameState()
+        game_state.add_player(Player(number=1, name="player1"))
+        game_state.add_player(Player(number=2, name="player2"))
+        self.assertTrue(validate_game_state(game_state))
+
+        # 番号の重複
+        game_state.add_player(Player(number=2, name="player3"))
+        self.assertFalse(validate_game_state(game_state))
+
+        # 死亡したプレイヤーが生存者リストに残っている
+        game_state.remove_player("player3")
+        game_state.players["player1"].is_alive = False
+        self.assertFalse(validate_game_state(game_state))
+
+    def test_validate_game_state_roles(self):
+        """ゲーム中の役職人数検証のテスト"""
+        game_state = GameState()
+        for number, role in enumerate(["villager", "werewolf"], start=1):
+            player = Player(number=number, name=f"player{number}")
+            player.assign_role(role)
+            game_state.add_player(player)
+        # アプリと同じく辞書形式のレギュレーションを設定
+        game_state.regulation = {
+            "roles": {"villager": 1, "werewolf": 1},
+            "round_times": [{"round": 1, "time": 5}],
+        }
+        game_state.game_active = True
+        self.assertTrue(validate_game_state(game_state))
+
+        # レギュレーションより人狼が多い
+        game_state.players["player1"].role = PlayerRole.WEREWOLF
+        self.assertFalse(validate_game_state(game_state))
+
+
+class TestRegulationSetting(unittest.TestCase):
+    def setUp(self):
+        """ウィンドウを作らずに役職人数の入力処理だけを準備する"""
+        self.tcl = tk.Tcl()
+        self.window = RegulationSettingWindow.__new__(RegulationSettingWindow)
+        self.window.logger = Mock()
+        self.window.state = RegulationState(role_counts=dict.fromkeys(ROLE_SETTINGS, 0))
+        self.window._role_vars = {
+            role_id: tk.StringVar(master=self.tcl, value="0")
+            for role_id in ROLE_SETTINGS
+        }
+        self.window._invalid_roles = set()
+        self.window._bulk_update = True
+        self.window.round_configs = []
+
+    def _input_role_count(self, role_id, text):
+        self.window._role_vars[role_id].set(text)
+        self.window._on_role_changed(role_id)
+
+    def test_role_count_rejects_non_integer(self):
+        """小数の役職人数は無効な入力として扱うテスト"""
+        self._input_role_count("werewolf", "2.5")
+        self.assertIn("werewolf", self.window._invalid_roles)
+        self.assertEqual(self.window.state.role_counts["werewolf"], 0)
+        with self.assertRaises(ValueError):
+            self.window._create_regulation_data()
+
+        # 整数に直せば有効な入力に戻る
+        self._input_role_count("werewolf", "2")
+        self.assertNotIn("werewolf", self.window._invalid_roles)
+        data = self.window._create_regulation_data()
+        self.assertEqual(data["roles"]["werewolf"], 2)
+        self.assertEqual(data["total_players"], 2)
+
+
 if __name__ == "__main__":
     unittest.main()
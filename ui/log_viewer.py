@@ -1,8 +1,13 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
 from dataclasses import dataclass, field
+import hashlib
 import json
 from datetime import datetime
 import logging
+import queue
+import sys
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -12,16 +17,66 @@ from core.events import EventType, GameEvent, event_manager
 from core.game_state import GamePhase
 from core.player import Player, PlayerRole
 
-
-@dataclass
+# ウィンドウサイズ
+_LOG_GEOMETRY = "{}x{}".format(*APP_SETTINGS["default_window_size"]["log_viewer"])
+
+# ログ表示用テキストウィジェットの設定
+_LOG_TEXT_OPTIONS = {
+    "wrap": tk.WORD,
+    "height": 20,
+    "state": "disabled",
+    "font": ("Helvetica", 10),
+    "padx": 5,
+    "pady": 5,
+    # 読み取り専用のため取り消し履歴は持たない
+    "undo": False,
+    "maxundo": 0,
+    "autoseparators": False,
+    "blockcursor": False,
+}
+
+
+@dataclass(slots=True)
+class NightActionDetails:
+    """夜アクションの詳細を表すデータクラス"""
+
+    attack_target: str
+    attack_success: bool
+    guard_target: str
+    fortune_target: str
+    fortune_result: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
 class LogEntry:
     """ログエントリーを表すデータクラス"""
 
     phase: GamePhase
     round: int
     action: str
-    details: Dict
-    timestamp: datetime = field(default_factory=datetime.now)
+    details: Union[Dict, NightActionDetails]
+    timestamp_raw: str = field(default_factory=lambda: datetime.now().isoformat())
+    _timestamp: Optional[datetime] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def timestamp(self) -> datetime:
+        """記録時刻（初回アクセス時に解析）"""
+        if self._timestamp is None:
+            object.__setattr__(
+                self, "_timestamp", datetime.fromisoformat(self.timestamp_raw)
+            )
+        return self._timestamp
+
+    @property
+    def time_text(self) -> str:
+        """表示用の時刻文字列 (HH:MM:SS)"""
+        raw = self.timestamp_raw
+        # ISO形式であれば解析せずに時刻部分を切り出す
+        if len(raw) >= 19 and raw[10] in "T " and raw[13] == raw[16] == ":":
+            return raw[11:19]
+        return self.timestamp.strftime("%H:%M:%S")
 
 
 @dataclass
@@ -37,6 +92,31 @@ class LogViewerState:
 class LogViewerWindow:
     """ログ確認ウィンドウ"""
 
+    # ログエントリーキャッシュの最大件数
+    _ENTRY_CACHE_SIZE = 512
+
+    # 解析結果の取り込み間隔（ミリ秒）
+    _DRAIN_INTERVAL_MS = 30
+
+    # 追従表示時のテキスト行数の上限と、超過時に削除する行数
+    _MAX_TEXT_LINES = 5000
+    _TRIM_TEXT_LINES = 1000
+
+    # (先頭ページか, 最終ページか) -> (前ボタン, 次ボタン) の状態
+    _NAV_STATES = {
+        (False, False): ("normal", "normal"),
+        (False, True): ("normal", "disabled"),
+        (True, False): ("disabled", "normal"),
+        (True, True): ("disabled", "disabled"),
+    }
+
+    # イベントタイプ -> ハンドラメソッド名
+    _EVENT_HANDLERS = {
+        EventType.GAME_LOG_UPDATED: "_handle_log_update",
+        EventType.GAME_STATE_RESET: "_handle_game_reset",
+        EventType.ERROR: "_handle_error",
+    }
+
     def __init__(self, parent: tk.Tk, store: GlobalDataStore):
         self.logger = logging.getLogger(__name__)
 
@@ -45,25 +125,39 @@ class LogViewerWindow:
         self.store = store
         self.window = tk.Toplevel(parent)
         self.window.title("ログ確認")
-        self.window.geometry(
-            f"{APP_SETTINGS['default_window_size']['log_viewer'][0]}x"
-            f"{APP_SETTINGS['default_window_size']['log_viewer'][1]}"
-        )
+        self.window.geometry(_LOG_GEOMETRY)
 
         # 状態管理
         self.state = LogViewerState()
+        self._entry_cache: "OrderedDict[str, LogEntry]" = OrderedDict()
+        self._page_texts: List[str] = []
+        self._page_labels: List[str] = []
+        self._last_raw_len = 0
+        self._generation = 0
+
+        # ログ解析ワーカーとの受け渡し
+        self._parse_queue: "queue.Queue[Optional[Tuple[int, List[Dict]]]]" = (
+            queue.Queue()
+        )
+        self._reply_queue: queue.Queue = queue.Queue()
+        self._pending_batches = 0
+        self._drain_after_id: Optional[str] = None
 
         # UI要素の参照
         self.log_text: Optional[tk.Text] = None
         self.page_info: Optional[ttk.Label] = None
         self.prev_button: Optional[ttk.Button] = None
         self.next_button: Optional[ttk.Button] = None
+        self._nav_state = ("disabled", "disabled")
+        self._needs_redraw = False
+        self._auto_follow = True
 
         # UIの初期化
         self._init_ui()
 
         # 初期データの設定
         self._initialize_data()
+        self._start_parse_worker()
 
         # イベントマネージャーへの登録
         event_manager.subscribe_all(self)
@@ -80,24 +174,44 @@ class LogViewerWindow:
         # ナビゲーションエリア
         self._create_navigation_area(main_frame)
 
+        # 再表示時に保留中の描画を反映
+        self.window.bind("<Map>", self._on_window_map)
+
     def _create_log_area(self, parent: ttk.Frame) -> None:
         """ログ表示エリアの作成"""
         log_frame = ttk.LabelFrame(parent, text="ログ内容", padding="5")
         log_frame.pack(fill="both", expand=True, pady=5)
 
         # テキストウィジェットとスクロールバー
-        self.log_text = tk.Text(log_frame, wrap=tk.WORD, height=20, state="disabled")
+        self.log_text = tk.Text(log_frame, **_LOG_TEXT_OPTIONS)
         scrollbar = ttk.Scrollbar(
-            log_frame, orient="vertical", command=self.log_text.yview
+            log_frame, orient="vertical", command=self._on_scrollbar
         )
         self.log_text.configure(yscrollcommand=scrollbar.set)
 
+        # ユーザーが末尾から離れたら追従を止める（既定のスクロール処理の後に判定）
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.log_text.bind(
+                sequence,
+                lambda e: self.window.after_idle(self._check_scroll_position),
+                add="+",
+            )
+
         # パッキング
         self.log_text.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # フォント設定
-        self.log_text.configure(font=("Helvetica", 10), padx=5, pady=5)
+    def _on_scrollbar(self, *args) -> None:
+        """スクロールバー操作によるスクロール"""
+        self.log_text.yview(*args)
+        self._check_scroll_position()
+
+    def _check_scroll_position(self) -> None:
+        """表示位置に応じて追従モードを切り替え（最新ページの末尾でのみ追従）"""
+        at_bottom = self.log_text.yview()[1] >= 1.0
+        self._auto_follow = (
+            at_bottom and self.state.current_page == len(self.state.logs) - 1
+        )
 
     def _create_navigation_area(self, parent: ttk.Frame) -> None:
         """ナビゲーションエリアの作成"""
@@ -128,38 +242,161 @@ class LogViewerWindow:
     def _initialize_data(self) -> None:
         """初期データの設定"""
         try:
-            raw_logs = self.store.game_state.game_log
-            self.state.logs = self._organize_logs(raw_logs)
+            raw_tail = self._take_new_raw_logs(self.store.game_state.game_log)
+            if raw_tail:
+                self._extend_logs(*self._build_pages(raw_tail, None))
             self._update_display()
             self.logger.info("Log viewer data initialized")
         except Exception as e:
             self.logger.error(f"Error initializing data: {str(e)}")
             self._show_error("データの初期化中にエラーが発生しました。")
 
-    def _organize_logs(self, raw_logs: List[Dict]) -> List[LogEntry]:
+    def _start_parse_worker(self) -> None:
+        """ログ解析用ワーカースレッドの開始"""
+        last_entry = self.state.logs[-1] if self.state.logs else None
+        self._parse_thread = threading.Thread(
+            target=self._parse_worker,
+            args=(last_entry, self._generation),
+            name="LogViewerParser",
+            daemon=True,
+        )
+        self._parse_thread.start()
+
+    def _parse_worker(self, last_entry: Optional[LogEntry], generation: int) -> None:
+        """ワーカースレッド: 未処理ログを整理し、結果を返信キューに送る"""
+        while True:
+            item = self._parse_queue.get()
+            if item is None:
+                break
+
+            batch_generation, raw_tail = item
+            # ログが整理し直された場合は先頭から整理する
+            if batch_generation != generation:
+                generation, last_entry = batch_generation, None
+
+            # 解析に失敗しても返信は必ず送り、待ち件数を減らせるようにする
+            try:
+                entries, texts, labels = self._build_pages(raw_tail, last_entry)
+            except Exception as e:
+                self.logger.error(f"Error parsing logs: {str(e)}")
+                entries, texts, labels = [], [], []
+            if entries:
+                last_entry = entries[-1]
+            self._reply_queue.put((batch_generation, entries, texts, labels))
+
+        self._entry_cache.clear()
+
+    def _take_new_raw_logs(self, raw_logs: List[Dict]) -> Optional[List[Dict]]:
+        """未処理の生ログを取り出す（変更がなければNone）"""
+        raw_len = len(raw_logs)
+        if raw_len == self._last_raw_len:
+            return None
+
+        # ログが巻き戻された場合は最初から整理し直す
+        if raw_len < self._last_raw_len:
+            self._clear_logs()
+
+        raw_tail = raw_logs[self._last_raw_len :]
+        self._last_raw_len = raw_len
+        return raw_tail
+
+    def _build_pages(
+        self, raw_tail: List[Dict], last_entry: Optional[LogEntry]
+    ) -> Tuple[List[LogEntry], List[str], List[str]]:
+        """ログを整理し、各ページの表示内容を事前に生成"""
+        entries = self._organize_logs(raw_tail, last_entry)
+        texts = [self._format_display_text(entry) for entry in entries]
+        labels = [
+            f"{entry.round}R {entry.phase.get_display_name()}" for entry in entries
+        ]
+        return entries, texts, labels
+
+    def _extend_logs(
+        self, entries: List[LogEntry], texts: List[str], labels: List[str]
+    ) -> int:
+        """整理済みログを追加し、追加された最初のエントリーの位置を返す"""
+        first_new = len(self.state.logs)
+        self.state.logs.extend(entries)
+        self._page_texts.extend(texts)
+        self._page_labels.extend(labels)
+        return first_new
+
+    def _drain_reply_queue(self) -> None:
+        """ワーカーの解析結果を取り込み、表示を更新"""
+        self._drain_after_id = None
+        first_new = None
+        try:
+            while True:
+                try:
+                    generation, entries, texts, labels = self._reply_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                self._pending_batches -= 1
+                if generation != self._generation:
+                    continue
+
+                index = self._extend_logs(entries, texts, labels)
+                if first_new is None:
+                    first_new = index
+
+            # 解析待ちのログが残っていれば再度取り込みを予約
+            if self._pending_batches > 0:
+                self._drain_after_id = self.window.after(
+                    self._DRAIN_INTERVAL_MS, self._drain_reply_queue
+                )
+
+            if first_new is not None and first_new < len(self.state.logs):
+                self._show_new_entries(first_new)
+
+        except Exception as e:
+            self.logger.error(f"Error draining parsed logs: {str(e)}")
+            self._show_error("表示の更新中にエラーが発生しました。")
+
+    def _show_new_entries(self, first_new: int) -> None:
+        """新しく追加されたエントリーを表示"""
+        # 最新ページ表示中は新しいエントリーを末尾に追加するだけで済ませる
+        if (
+            self._auto_follow
+            and 0 < first_new == self.state.current_page + 1
+            and not self._needs_redraw
+            and not self._is_window_hidden()
+        ):
+            self._append_display(first_new)
+        else:
+            self.state.current_page = len(self.state.logs) - 1  # 最新のログを表示
+            self._auto_follow = True  # 最新ページに戻ったので追従を再開
+            self._request_redraw()
+        self.logger.info("Log viewer updated with new log entry")
+
+    def _clear_logs(self) -> None:
+        """整理済みログのクリア"""
+        self.state.logs = []
+        self._page_texts = []
+        self._page_labels = []
+        self._last_raw_len = 0
+        # 解析中の古いログの結果を破棄する
+        self._generation += 1
+
+    def _organize_logs(
+        self, raw_logs: List[Dict], last_entry: Optional[LogEntry] = None
+    ) -> List[LogEntry]:
         """ログデータを整理"""
         try:
             organized_logs = []
-            current_round = None
-            current_phase = None
+            # 直前のエントリーと同じラウンド・フェーズのログは追加しない
+            current_round = last_entry.round if last_entry else None
+            current_phase = last_entry.phase if last_entry else None
 
             for log in raw_logs:
                 # フェーズとラウンドの取得
                 round_num = log.get("round")
                 phase = GamePhase(log.get("phase"))
-                action = log.get("action")
+                action = sys.intern(log.get("action") or "")
 
                 # 新しいラウンドまたはフェーズの開始
                 if round_num != current_round or phase != current_phase:
-                    log_entry = LogEntry(
-                        phase=phase,
-                        round=round_num,
-                        action=action,
-                        details=self._extract_log_details(log),
-                        timestamp=datetime.fromisoformat(
-                            log.get("timestamp", datetime.now().isoformat())
-                        ),
-                    )
+                    log_entry = self._get_log_entry(log, phase, round_num, action)
                     organized_logs.append(log_entry)
                     current_round = round_num
                     current_phase = phase
@@ -170,28 +407,37 @@ class LogViewerWindow:
             self.logger.error(f"Error organizing logs: {str(e)}")
             return []
 
+    def _get_log_entry(
+        self, log: Dict, phase: GamePhase, round_num: int, action: str
+    ) -> LogEntry:
+        """ログエントリーを取得（同一内容のログはキャッシュを共有）"""
+        key = hashlib.blake2b(
+            json.dumps(log, sort_keys=True, default=str).encode(), digest_size=16
+        ).hexdigest()
+
+        log_entry = self._entry_cache.get(key)
+        if log_entry is not None:
+            self._entry_cache.move_to_end(key)
+            return log_entry
+
+        log_entry = LogEntry(
+            phase=phase,
+            round=round_num,
+            action=action,
+            details=self._extract_log_details(log),
+            timestamp_raw=log.get("timestamp", datetime.now().isoformat()),
+        )
+        self._entry_cache[key] = log_entry
+        if len(self._entry_cache) > self._ENTRY_CACHE_SIZE:
+            self._entry_cache.popitem(last=False)
+        return log_entry
+
     def _extract_log_details(self, log: Dict) -> Dict:
         """ログの詳細情報を抽出"""
         try:
-            details = {}
-
             # アクションタイプに基づいて詳細を抽出
-            action = log.get("action")
-            if action == "execution":
-                details = self._extract_execution_details(log)
-            elif action == "night_actions":
-                details = self._extract_night_action_details(log)
-            elif action == "phase_start":
-                details = {"message": f"{log.get('phase')} フェーズ開始"}
-            elif action == "game_start":
-                details = {"message": "ゲーム開始"}
-            elif action == "game_end":
-                details = {
-                    "winning_team": log.get("winning_team"),
-                    "final_round": log.get("final_round"),
-                }
-
-            return details
+            extractor = self._EXTRACTORS.get(log.get("action"))
+            return extractor(self, log) if extractor else {}
 
         except Exception as e:
             self.logger.error(f"Error extracting log details: {str(e)}")
@@ -213,125 +459,135 @@ class LogViewerWindow:
             "original_role": role,
         }
 
-    def _extract_night_action_details(self, log: Dict) -> Dict:
+    def _extract_night_action_details(self, log: Dict) -> NightActionDetails:
         """夜アクションの詳細を抽出"""
-        details = {
-            "attack": {
-                "target": log.get("attack_target", "対象なし"),
-                "success": log.get("attack_target") != log.get("guard_target"),
-            },
-            "guard": {"target": log.get("guard_target", "対象なし")},
-            "fortune": {
-                "target": log.get("fortune_target", "対象なし"),
-                "result": None,
-            },
-        }
+        details = NightActionDetails(
+            attack_target=log.get("attack_target", "対象なし"),
+            attack_success=log.get("attack_target") != log.get("guard_target"),
+            guard_target=log.get("guard_target", "対象なし"),
+            fortune_target=log.get("fortune_target", "対象なし"),
+        )
 
         # 占い結果の処理
         fortune_target = log.get("fortune_target")
         if fortune_target != "対象なし":
             fortune_result = log.get("fortune_result", "")
-            result_name = (
+            details.fortune_result = (
                 ROLE_SETTINGS[fortune_result]["name"]
                 if fortune_result in ROLE_SETTINGS
                 else "不明"
             )
-            details["fortune"]["result"] = result_name
 
         return details
 
+    def _extract_phase_start_details(self, log: Dict) -> Dict:
+        """フェーズ開始の詳細を抽出"""
+        return {"message": f"{log.get('phase')} フェーズ開始"}
+
+    def _extract_game_start_details(self, log: Dict) -> Dict:
+        """ゲーム開始の詳細を抽出"""
+        return {"message": "ゲーム開始"}
+
+    def _extract_game_end_details(self, log: Dict) -> Dict:
+        """ゲーム終了の詳細を抽出"""
+        return {
+            "winning_team": log.get("winning_team"),
+            "final_round": log.get("final_round"),
+        }
+
+    # アクションごとの詳細抽出関数
+    _EXTRACTORS = {
+        "execution": _extract_execution_details,
+        "night_actions": _extract_night_action_details,
+        "phase_start": _extract_phase_start_details,
+        "game_start": _extract_game_start_details,
+        "game_end": _extract_game_end_details,
+    }
+
     def _format_display_text(self, log_entry: LogEntry) -> str:
         """ログエントリーの表示テキストを生成"""
         try:
-            text_lines = []
-
-            if log_entry.action == "execution":
-                text_lines.extend(self._format_execution_text(log_entry.details))
-            elif log_entry.action == "night_actions":
-                text_lines.extend(self._format_night_actions_text(log_entry.details))
-            elif log_entry.action == "phase_start":
-                text_lines.append(log_entry.details.get("message", ""))
-            elif log_entry.action == "game_start":
-                text_lines.append("=== ゲーム開始 ===")
-            elif log_entry.action == "game_end":
-                text_lines.extend(self._format_game_end_text(log_entry.details))
-
-            # タイムスタンプの追加
-            time_str = log_entry.timestamp.strftime("%H:%M:%S")
-            text_lines.append(f"[記録時刻: {time_str}]\n")
+            # タイムスタンプ行
+            time_line = f"[記録時刻: {log_entry.time_text}]\n"
 
-            return "\n".join(text_lines)
+            formatter = self._FORMATTERS.get(log_entry.action)
+            if formatter is None:
+                return time_line
+            return f"{formatter(self, log_entry.details)}\n{time_line}"
 
         except Exception as e:
             self.logger.error(f"Error formatting display text: {str(e)}")
             return "ログの表示中にエラーが発生しました。"
 
-    def _format_execution_text(self, details: Dict) -> List[str]:
+    def _format_execution_text(self, details: Dict) -> str:
         """処刑アクションのテキストをフォーマット"""
         if details["target"] == "対象なし":
-            return ["処刑: 対象なし"]
+            return "処刑: 対象なし"
 
-        return [f"処刑: {details['target']}", f"役職: {details['role']}"]
+        return f"処刑: {details['target']}\n役職: {details['role']}"
 
-    def _format_night_actions_text(self, details: Dict) -> List[str]:
+    def _format_night_actions_text(self, details: NightActionDetails) -> str:
         """夜アクションのテキストをフォーマット"""
-        text_lines = []
-
         # 襲撃結果
-        attack = details["attack"]
-        if attack["target"] == "対象なし":
-            text_lines.append("襲撃: 対象なし")
+        if details.attack_target == "対象なし":
+            attack_text = "襲撃: 対象なし"
         else:
-            result = "成功" if attack["success"] else "失敗"
-            text_lines.append(f"襲撃: {attack['target']} ({result})")
-
-        # 護衛結果
-        guard = details["guard"]
-        text_lines.append(f"護衛: {guard['target']}")
+            result = "成功" if details.attack_success else "失敗"
+            attack_text = f"襲撃: {details.attack_target} ({result})"
 
         # 占い結果
-        fortune = details["fortune"]
-        if fortune["target"] == "対象なし":
-            text_lines.append("占い: 対象なし")
+        if details.fortune_target == "対象なし":
+            fortune_text = "占い: 対象なし"
         else:
-            text_lines.append(
-                f"占い: {fortune['target']} "
-                f"(結果: {fortune['result'] if fortune['result'] else '不明'})"
+            fortune_text = (
+                f"占い: {details.fortune_target} "
+                f"(結果: {details.fortune_result if details.fortune_result else '不明'})"
             )
 
-        return text_lines
+        return f"{attack_text}\n護衛: {details.guard_target}\n{fortune_text}"
 
-    def _format_game_end_text(self, details: Dict) -> List[str]:
+    def _format_game_end_text(self, details: Dict) -> str:
         """ゲーム終了時のテキストをフォーマット"""
-        return [
-            "=== ゲーム終了 ===",
-            f"勝利陣営: {details['winning_team']}チーム",
-            f"最終ラウンド: {details['final_round']}R",
-        ]
+        return (
+            f"=== ゲーム終了 ===\n"
+            f"勝利陣営: {details['winning_team']}チーム\n"
+            f"最終ラウンド: {details['final_round']}R"
+        )
+
+    def _format_phase_start_text(self, details: Dict) -> str:
+        """フェーズ開始のテキストをフォーマット"""
+        return details.get("message", "")
+
+    def _format_game_start_text(self, details: Dict) -> str:
+        """ゲーム開始時のテキストをフォーマット"""
+        return "=== ゲーム開始 ==="
+
+    # アクションごとのテキストフォーマット関数
+    _FORMATTERS = {
+        "execution": _format_execution_text,
+        "night_actions": _format_night_actions_text,
+        "phase_start": _format_phase_start_text,
+        "game_start": _format_game_start_text,
+        "game_end": _format_game_end_text,
+    }
 
     def _update_display(self) -> None:
         """表示の更新"""
         try:
-            self.log_text.config(state="normal")
-            self.log_text.delete("1.0", tk.END)
-
             if not self.state.logs:
-                self.log_text.insert("1.0", "ログはありません")
-                self.page_info.config(text="ログなし")
-                self._update_navigation_buttons()
-                return
+                display_text = "ログはありません"
+                page_text = "ログなし"
+            else:
+                display_text = self._page_texts[self.state.current_page]
+                page_text = self._page_labels[self.state.current_page]
 
-            log_entry = self.state.logs[self.state.current_page]
-            display_text = self._format_display_text(log_entry)
+            # ログテキストの更新（1回の編集で置き換え）
+            self.log_text.config(state="normal")
+            self.log_text.replace("1.0", "end-1c", display_text)
+            self.log_text.config(state="disabled")
 
             # ページ情報の更新
-            self.page_info.config(
-                text=f"{log_entry.round}R {log_entry.phase.get_display_name()}"
-            )
-
-            # ログテキストの更新
-            self.log_text.insert("1.0", display_text)
-            self.log_text.config(state="disabled")
+            self.page_info.config(text=page_text)
 
             # ナビゲーションボタンの更新
             self._update_navigation_buttons()
@@ -340,36 +596,70 @@ class LogViewerWindow:
             self.logger.error(f"Error updating display: {str(e)}")
             self._show_error("表示の更新中にエラーが発生しました。")
 
+    def _is_window_hidden(self) -> bool:
+        """ウィンドウが非表示かどうか"""
+        return self.window.state() in ("withdrawn", "iconic")
+
+    def _request_redraw(self) -> None:
+        """表示の更新を要求（ウィンドウ非表示中は再表示まで保留）"""
+        if self._is_window_hidden():
+            self._needs_redraw = True
+            return
+        self._flush_redraw()
+
+    def _append_display(self, first_new: int) -> None:
+        """追従モードで新しいエントリーのみを末尾に追加表示"""
+        try:
+            new_text = "".join(f"\n{text}" for text in self._page_texts[first_new:])
+
+            self.log_text.config(state="normal")
+            self.log_text.insert("end", new_text)
+
+            # 行数が上限を超えたら古い行をまとめて削除
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > self._MAX_TEXT_LINES:
+                self.log_text.delete("1.0", f"{self._TRIM_TEXT_LINES + 1}.0")
+            self.log_text.config(state="disabled")
+            self.log_text.see("end")
+
+            self.state.current_page = len(self.state.logs) - 1
+            self.page_info.config(text=self._page_labels[-1])
+            self._update_navigation_buttons()
+
+        except Exception as e:
+            self.logger.error(f"Error appending display: {str(e)}")
+            self._show_error("表示の更新中にエラーが発生しました。")
+
+    def _flush_redraw(self) -> None:
+        """保留中の描画を反映"""
+        self._needs_redraw = False
+        self._update_display()
+
+    def _on_window_map(self, event: tk.Event) -> None:
+        """ウィンドウ再表示時の処理"""
+        if event.widget is self.window and self._needs_redraw:
+            self._flush_redraw()
+
     def _update_navigation_buttons(self) -> None:
         """ナビゲーションボタンの状態を更新"""
-        if not self.state.logs:
-            self.prev_button.config(state="disabled")
-            self.next_button.config(state="disabled")
-            return
+        if self.state.logs:
+            page = self.state.current_page
+            new_state = self._NAV_STATES[(page == 0, page == len(self.state.logs) - 1)]
+        else:
+            new_state = ("disabled", "disabled")
 
-        self.prev_button.config(
-            state="normal" if self.state.current_page > 0 else "disabled"
-        )
-        self.next_button.config(
-            state=(
-                "normal"
-                if self.state.current_page < len(self.state.logs) - 1
-                else "disabled"
-            )
-        )
+        # 状態が変わった場合のみウィジェットを更新
+        if new_state != self._nav_state:
+            self.prev_button.config(state=new_state[0])
+            self.next_button.config(state=new_state[1])
+            self._nav_state = new_state
 
     def handle_event(self, event: GameEvent) -> None:
         """イベントハンドラ"""
         try:
-            handlers = {
-                EventType.GAME_LOG_UPDATED: self._handle_log_update,
-                EventType.GAME_STATE_RESET: self._handle_game_reset,
-                EventType.ERROR: self._handle_error,
-            }
-
-            handler = handlers.get(event.type)
-            if handler:
-                handler(event)
+            handler_name = self._EVENT_HANDLERS.get(event.type)
+            if handler_name:
+                getattr(self, handler_name)(event)
                 self.state.last_update = datetime.now()
 
         except Exception as e:
@@ -379,11 +669,17 @@ class LogViewerWindow:
     def _handle_log_update(self, event: GameEvent) -> None:
         """ログ更新イベントの処理"""
         try:
-            raw_logs = self.store.game_state.game_log
-            self.state.logs = self._organize_logs(raw_logs)
-            self.state.current_page = len(self.state.logs) - 1  # 最新のログを表示
-            self._update_display()
-            self.logger.info("Log viewer updated with new log entry")
+            raw_tail = self._take_new_raw_logs(self.store.game_state.game_log)
+            if not raw_tail:
+                return
+
+            # 解析はワーカースレッドで行い、結果を定期的に取り込む
+            self._parse_queue.put((self._generation, raw_tail))
+            self._pending_batches += 1
+            if self._drain_after_id is None:
+                self._drain_after_id = self.window.after(
+                    self._DRAIN_INTERVAL_MS, self._drain_reply_queue
+                )
         except Exception as e:
             self.logger.error(f"Error handling log update: {str(e)}")
             raise
@@ -392,7 +688,9 @@ class LogViewerWindow:
         """ゲームリセットイベントの処理"""
         try:
             self.state = LogViewerState()
-            self._update_display()
+            self._clear_logs()
+            self._auto_follow = True
+            self._request_redraw()
             self.logger.info("Log viewer reset")
         except Exception as e:
             self.logger.error(f"Error handling game reset: {str(e)}")
@@ -413,20 +711,36 @@ class LogViewerWindow:
         """前のページに移動"""
         if self.state.current_page > 0:
             self.state.current_page -= 1
+            self._auto_follow = False
             self._update_display()
 
     def _next_page(self) -> None:
         """次のページに移動"""
         if self.state.current_page < len(self.state.logs) - 1:
             self.state.current_page += 1
+            self._auto_follow = self.state.current_page == len(self.state.logs) - 1
             self._update_display()
 
     def destroy(self) -> None:
         """ウィンドウの破棄"""
         try:
             if hasattr(self, "window"):
-                self.window.destroy()
+                # 破棄済みウィジェットへのイベント配信を防ぐため先に登録解除
                 event_manager.unsubscribe_all(self)
+                if self._drain_after_id is not None:
+                    self.window.after_cancel(self._drain_after_id)
+                    self._drain_after_id = None
+                self.window.destroy()
+
+                # ワーカーを停止（エントリーキャッシュはワーカー側で解放）
+                self._parse_queue.put(None)
+
+                # 保持しているログと参照を解放
+                self.state.logs = []
+                self._page_texts = []
+                self._page_labels = []
+                self.log_text = None
+                self.parent = None
                 self.logger.info("Log viewer window destroyed")
         except Exception as e:
             self.logger.error(f"Error destroying window: {str(e)}")
@@ -1,30 +1,57 @@
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 import re
+import time
 import logging
+from functools import partial
+from operator import attrgetter
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime
 
 from config.settings import APP_SETTINGS, ROLE_SETTINGS
 from store.global_data_store import GlobalDataStore
 from core.player import Player, PlayerRole
 from core.events import EventType, GameEvent, event_manager
 
+# プレイヤーリスト入力の1行（形式: 番号.名前[/別名]、前後の空白は無視）
+_PLAYER_LINE_RE = re.compile(
+    r"^[^\S\n]*(?P<number>\d+)\.(?P<names>.*?\S)[^\S\n]*$", re.MULTILINE
+)
 
-@dataclass
+
+def _role_display(role: Optional[PlayerRole]) -> str:
+    """役職の表示名を取得（未割当の場合は空文字）"""
+    get_display_name = getattr(role, "get_display_name", None) if role else None
+    return get_display_name() if get_display_name else ""
+
+
+@dataclass(slots=True)
 class ParticipantListState:
     """参加者リストの状態を管理するデータクラス"""
 
     participants: List[Player] = field(default_factory=list)
     non_participants: List[Player] = field(default_factory=list)
     is_confirmed: bool = False
-    last_update: datetime = field(default_factory=datetime.now)
+    last_update_ts: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class TreeRowCache:
+    """Treeviewの行とプレイヤーの対応を管理するデータクラス"""
+
+    items: Dict[int, str] = field(default_factory=dict)  # id(player) -> 行ID
+    values: Dict[str, Tuple] = field(default_factory=dict)  # 行ID -> 表示値
+    order: List[str] = field(default_factory=list)  # 表示中の行IDの並び
+    free: List[str] = field(default_factory=list)  # 再利用可能な切り離し済み行ID
+    players: Dict[str, Player] = field(default_factory=dict)  # 行ID -> プレイヤー
 
 
 class ParticipantListWindow:
     """参加者一覧ウィンドウ"""
 
+    # 列幅調整を遅延させる時間（ミリ秒）
+    _RESIZE_DELAY_MS = 50
+
     def __init__(self, parent: tk.Tk, store: GlobalDataStore):
         self.logger = logging.getLogger(__name__)
 
@@ -40,6 +67,17 @@ class ParticipantListWindow:
 
         # 状態管理
         self.state = ParticipantListState()
+        self._participant_rows = TreeRowCache()
+        self._non_participant_rows = TreeRowCache()
+
+        # 番号順に並べたプレイヤー一覧のキャッシュ（リスト変更時に破棄）
+        self._sorted_participants: Optional[List[Player]] = None
+        self._sorted_non_participants: Optional[List[Player]] = None
+
+        # プレイヤー検索用インデックス
+        self._by_name: Dict[str, Player] = {}  # 参加者の名前 -> プレイヤー
+        self._by_key: Dict[Tuple[int, str], Player] = {}  # (番号, 名前) -> プレイヤー
+        self._list_indices: Dict[int, int] = {}  # id(player) -> 所属リスト内の位置
 
         # UIコンポーネント参照の初期化
         self.participant_tree: Optional[ttk.Treeview] = None
@@ -47,6 +85,31 @@ class ParticipantListWindow:
         self.confirm_button: Optional[ttk.Button] = None
         self.context_menus: Dict[str, tk.Menu] = {}
 
+        # 列幅調整の遅延実行用（ツリーのパス名 -> after ID / 適用済みの幅）
+        self._resize_after_ids: Dict[str, str] = {}
+        self._last_tree_widths: Dict[str, int] = {}
+
+        # 使い回すダイアログ（初回表示時に作成）
+        self._input_dialog: Optional[tk.Toplevel] = None
+        self._input_text: Optional[tk.Text] = None
+        self._edit_dialog: Optional[tk.Toplevel] = None
+        self._edit_number_var: Optional[tk.StringVar] = None
+        self._edit_name_var: Optional[tk.StringVar] = None
+        self._edit_target: Optional[Player] = None
+
+        # ツリー更新の集約用
+        self._update_pending = False
+        self._after_id: Optional[str] = None
+
+        # イベントハンドラの対応表
+        self._event_handlers = {
+            EventType.GAME_STATE_RESET: self._handle_game_reset,
+            EventType.PLAYER_ROLE_ASSIGNED: self._handle_role_assigned,
+            EventType.PLAYER_DIED: self._handle_player_death,
+            EventType.GAME_STATE_UPDATED: self._handle_game_state_update,
+            EventType.ERROR: self._handle_error,
+        }
+
         # UIの初期化
         self._init_ui()
         self._create_context_menus()
@@ -97,13 +160,18 @@ class ParticipantListWindow:
         tree.heading("role", text="役職")
         tree.heading("status", text="ステータス")
 
+        tree_key = str(tree)
+
         # 列幅の動的設定用関数
         def configure_column_widths(event=None):
+            self._resize_after_ids.pop(tree_key, None)
             if not tree.winfo_exists():
                 return
 
             tree_width = tree.winfo_width()
-            if tree_width > 1:  # 有効な幅の場合のみ処理
+            # 有効な幅で、前回から変化した場合のみ処理
+            if tree_width > 1 and tree_width != self._last_tree_widths.get(tree_key):
+                self._last_tree_widths[tree_key] = tree_width
                 scrollbar_width = 20
                 available_width = max(tree_width - scrollbar_width, 380)  # 最小幅を確保
 
@@ -120,8 +188,17 @@ class ParticipantListWindow:
                     width = int(available_width * ratio)
                     tree.column(column, width=width, minwidth=int(width * 0.8))
 
+        # サイズ変更中の連続イベントはまとめて最後に1回だけ処理
+        def schedule_column_widths(event=None):
+            after_id = self._resize_after_ids.get(tree_key)
+            if after_id is not None:
+                tree.after_cancel(after_id)
+            self._resize_after_ids[tree_key] = tree.after(
+                self._RESIZE_DELAY_MS, configure_column_widths
+            )
+
         # ウィンドウサイズ変更時のイベントバインド
-        tree.bind("<Configure>", configure_column_widths)
+        tree.bind("<Configure>", schedule_column_widths)
 
         # 初期サイズの設定
         tree.update_idletasks()
@@ -170,7 +247,7 @@ class ParticipantListWindow:
         self.context_menus["participant"] = tk.Menu(self.window, tearoff=0)
         self.context_menus["participant"].add_command(
             label="不参加リストへ移動",
-            command=lambda: self._move_player("to_non_participant"),
+            command=partial(self._move_player, "to_non_participant"),
         )
         self.context_menus["participant"].add_command(
             label="番号/名前を編集", command=self._edit_player
@@ -180,12 +257,18 @@ class ParticipantListWindow:
         self.context_menus["non_participant"] = tk.Menu(self.window, tearoff=0)
         self.context_menus["non_participant"].add_command(
             label="参加リストへ移動",
-            command=lambda: self._move_player("to_participant"),
+            command=partial(self._move_player, "to_participant"),
         )
         self.context_menus["non_participant"].add_command(
             label="番号/名前を編集", command=self._edit_player
         )
 
+        # 項目数と現在の状態を保持し、状態切り替え時の問い合わせを省く
+        self._menu_entry_counts = {
+            key: menu.index("end") + 1 for key, menu in self.context_menus.items()
+        }
+        self._menu_state = "normal"
+
     def _show_context_menu(self, event: tk.Event):
         """右クリックメニューの表示"""
         if self.state.is_confirmed:
@@ -214,15 +297,16 @@ class ParticipantListWindow:
             if not selection:
                 return
 
+            # 行IDから直接プレイヤーを引く（ツリーへの値の問い合わせは不要）
+            source_rows = self._get_row_cache(source_tree)
             moved_players = []
-            for item in selection:
-                values = source_tree.item(item)["values"]
-                player = self._find_player_by_values(values, direction)
+            for iid in selection:
+                player = source_rows.players.get(iid)
                 if player:
                     self._perform_player_move(player, direction)
                     moved_players.append(player.name)
 
-            self._update_trees()
+            self._schedule_tree_update()
             self._notify_player_movement(direction, moved_players)
 
         except Exception as e:
@@ -235,30 +319,74 @@ class ParticipantListWindow:
             return self.participant_tree, self.non_participant_tree
         return self.non_participant_tree, self.participant_tree
 
-    def _find_player_by_values(self, values: list, direction: str) -> Optional[Player]:
-        """ツリーの値からプレイヤーを検索"""
-        source_list = (
-            self.state.participants
-            if direction == "to_non_participant"
-            else self.state.non_participants
-        )
-        return next(
-            (
-                p
-                for p in source_list
-                if str(p.number) == str(values[0]) and p.name == values[1]
-            ),
-            None,
-        )
+    def _get_row_cache(self, tree: ttk.Treeview) -> TreeRowCache:
+        """ツリーに対応する行キャッシュを取得"""
+        if tree == self.participant_tree:
+            return self._participant_rows
+        return self._non_participant_rows
 
     def _perform_player_move(self, player: Player, direction: str) -> None:
         """プレイヤーの移動を実行"""
         if direction == "to_non_participant":
-            self.state.participants.remove(player)
-            self.state.non_participants.append(player)
+            self._swap_remove(self.state.participants, player)
+            self._append_indexed(self.state.non_participants, player)
+            if self._by_name.get(player.name) is player:
+                del self._by_name[player.name]
         else:
-            self.state.non_participants.remove(player)
-            self.state.participants.append(player)
+            self._swap_remove(self.state.non_participants, player)
+            self._append_indexed(self.state.participants, player)
+            self._by_name.setdefault(player.name, player)
+
+        # 表示順は描画時に番号順で決まるため、リスト内の順序は保持しない
+        self._invalidate_sorted_players()
+
+    def _swap_remove(self, players: List[Player], player: Player) -> None:
+        """末尾の要素と入れ替えてリストから削除"""
+        index = self._list_indices.pop(id(player), None)
+        if index is None:
+            players.remove(player)
+            return
+
+        last = players.pop()
+        if last is not player:
+            players[index] = last
+            self._list_indices[id(last)] = index
+
+    def _append_indexed(self, players: List[Player], player: Player) -> None:
+        """リスト内の位置を記録して末尾に追加"""
+        self._list_indices[id(player)] = len(players)
+        players.append(player)
+
+    def _invalidate_sorted_players(self) -> None:
+        """番号順キャッシュの破棄"""
+        self._sorted_participants = None
+        self._sorted_non_participants = None
+
+    def _rebuild_player_index(self) -> None:
+        """プレイヤー検索用インデックスの再構築"""
+        self._by_name = {}
+        for player in self.state.participants:
+            self._by_name.setdefault(player.name, player)
+
+        self._by_key = {}
+        for player in self.state.participants + self.state.non_participants:
+            self._by_key.setdefault((player.number, player.name), player)
+
+        self._list_indices = {
+            id(player): index
+            for players in (self.state.participants, self.state.non_participants)
+            for index, player in enumerate(players)
+        }
+
+    def _reindex_player(self, player: Player, old_number: int, old_name: str) -> None:
+        """編集されたプレイヤーのインデックスを更新"""
+        if self._by_key.get((old_number, old_name)) is player:
+            del self._by_key[(old_number, old_name)]
+        self._by_key.setdefault((player.number, player.name), player)
+
+        if self._by_name.get(old_name) is player:
+            del self._by_name[old_name]
+            self._by_name.setdefault(player.name, player)
 
     def _notify_player_movement(self, direction: str, moved_players: List[str]) -> None:
         """プレイヤー移動のイベント通知"""
@@ -278,9 +406,20 @@ class ParticipantListWindow:
             self._show_error("参加者リストは確定済みのため追加できません。")
             return
 
+        # ダイアログは初回のみ作成し、以降は再表示して使い回す
+        if self._input_dialog is None:
+            self._create_input_dialog()
+
+        self._input_text.delete("1.0", tk.END)
+        self._input_dialog.deiconify()
+        self._input_dialog.lift()
+
+    def _create_input_dialog(self) -> None:
+        """プレイヤーリスト入力ダイアログの作成"""
         dialog = tk.Toplevel(self.window)
         dialog.title("プレイヤーリスト入力")
         dialog.geometry("400x300")
+        dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
 
         ttk.Label(
             dialog, text="プレイヤーリストを入力してください。\n形式: 番号.名前[/別名]"
@@ -289,11 +428,14 @@ class ParticipantListWindow:
         text = tk.Text(dialog, height=10)
         text.pack(fill="both", expand=True, padx=5, pady=5)
 
-        ttk.Button(
-            dialog,
-            text="登録",
-            command=lambda: self._process_player_input(text.get("1.0", tk.END).strip()),
-        ).pack(pady=5)
+        ttk.Button(dialog, text="登録", command=self._submit_player_input).pack(pady=5)
+
+        self._input_dialog = dialog
+        self._input_text = text
+
+    def _submit_player_input(self) -> None:
+        """入力ダイアログの内容を登録"""
+        self._process_player_input(self._input_text.get("1.0", tk.END).strip())
 
     def _process_player_input(self, content: str) -> None:
         """プレイヤーリストの処理"""
@@ -304,25 +446,17 @@ class ParticipantListWindow:
             new_participants = []
             new_non_participants = []
 
-            for line in content.split("\n"):
-                if not line.strip():
-                    continue
-
-                match = re.match(r"(\d+)\.(.+)", line.strip())
-                if not match:
-                    continue
-
-                number, names = match.groups()
-                name_list = [n.strip() for n in names.split("/")]
+            for match in _PLAYER_LINE_RE.finditer(content):
+                number = int(match["number"])
+                name_list = [n.strip() for n in match["names"].split("/")]
 
                 # メインプレイヤーの作成
-                main_player = Player(number=int(number), name=name_list[0])
-                new_participants.append(main_player)
+                new_participants.append(Player(number=number, name=name_list[0]))
 
                 # 別名プレイヤーの作成
-                for alt_name in name_list[1:]:
-                    non_participant = Player(number=int(number), name=alt_name)
-                    new_non_participants.append(non_participant)
+                new_non_participants.extend(
+                    Player(number=number, name=alt_name) for alt_name in name_list[1:]
+                )
 
             self._update_player_lists(new_participants, new_non_participants)
 
@@ -338,7 +472,8 @@ class ParticipantListWindow:
             # 状態の更新
             self.state.participants = new_participants
             self.state.non_participants = new_non_participants
-            self.state.last_update = datetime.now()
+            self._rebuild_player_index()
+            self._invalidate_sorted_players()
 
             # UIの更新
             self._update_trees()
@@ -422,6 +557,19 @@ class ParticipantListWindow:
         except Exception as e:
             self.logger.error(f"Error updating trees: {str(e)}")
 
+    def _schedule_tree_update(self) -> None:
+        """ツリー更新をアイドル時にまとめて実行するよう予約"""
+        self._update_pending = True
+        if self._after_id is None:
+            self._after_id = self.window.after_idle(self._flush_tree_updates)
+
+    def _flush_tree_updates(self) -> None:
+        """予約されたツリー更新の実行"""
+        self._after_id = None
+        if self._update_pending:
+            self._update_pending = False
+            self._update_trees()
+
     def _update_participant_tree(self) -> None:
         """参加者ツリーの更新"""
         if (
@@ -430,23 +578,34 @@ class ParticipantListWindow:
         ):
             return
 
-        self.participant_tree.delete(*self.participant_tree.get_children())
-        for player in sorted(self.state.participants, key=lambda x: x.number):
-            role_display = ""
-            if player.role and hasattr(player.role, "get_display_name"):
-                role_display = player.role.get_display_name()
-
-            self.participant_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    player.number,
-                    player.name,
-                    role_display,
-                    "生存" if player.is_alive else "死亡",
-                ),
+        if self._sorted_participants is None:
+            self._sorted_participants = sorted(
+                self.state.participants, key=attrgetter("number")
             )
 
+        rows = [
+            (player, self._participant_row(player))
+            for player in self._sorted_participants
+        ]
+
+        self._sync_tree(self.participant_tree, self._participant_rows, rows)
+
+    def _participant_row(self, player: Player) -> Tuple:
+        """参加者ツリーの表示値"""
+        return (
+            player.number,
+            player.name,
+            _role_display(player.role),
+            "生存" if player.is_alive else "死亡",
+        )
+
+    def _is_row_stale(self, player: Player) -> bool:
+        """参加者の表示内容が現在の状態と異なるかどうか"""
+        iid = self._participant_rows.items.get(id(player))
+        if iid is None:
+            return True
+        return self._participant_rows.values.get(iid) != self._participant_row(player)
+
     def _update_non_participant_tree(self) -> None:
         """不参加者ツリーの更新"""
         if (
@@ -455,28 +614,74 @@ class ParticipantListWindow:
         ):
             return
 
-        self.non_participant_tree.delete(*self.non_participant_tree.get_children())
-        for player in sorted(self.state.non_participants, key=lambda x: x.number):
-            self.non_participant_tree.insert(
-                "", tk.END, values=(player.number, player.name, "", "")
+        # 不参加者がおらず表示中の行もなければ何もしない
+        if not self.state.non_participants and not self._non_participant_rows.items:
+            return
+
+        if self._sorted_non_participants is None:
+            self._sorted_non_participants = sorted(
+                self.state.non_participants, key=attrgetter("number")
             )
 
+        rows = [
+            (player, (player.number, player.name, "", ""))
+            for player in self._sorted_non_participants
+        ]
+        self._sync_tree(self.non_participant_tree, self._non_participant_rows, rows)
+
+    def _sync_tree(
+        self,
+        tree: ttk.Treeview,
+        cache: TreeRowCache,
+        rows: List[Tuple[Player, Tuple]],
+    ) -> None:
+        """ツリーの行を差分更新（変更のあった行のみ反映）"""
+        # 行の追加・更新はラッパーの引数処理を省いてTclコマンドを直接呼ぶ
+        call = tree.tk.call
+        widget = tree._w
+        order = []
+        for player, values in rows:
+            key = id(player)
+            iid = cache.items.get(key)
+            if iid is None:
+                if cache.free:
+                    # 切り離し済みの行を再利用
+                    iid = cache.free.pop()
+                else:
+                    iid = call(widget, "insert", "", "end", "-values", values)
+                    cache.values[iid] = values
+                cache.items[key] = iid
+                cache.players[iid] = player
+
+            if cache.values.get(iid) != values:
+                call(widget, "item", iid, "-values", values)
+                cache.values[iid] = values
+            order.append(iid)
+
+        # 表示されなくなった行は切り離して再利用に回す
+        if len(cache.items) > len(order):
+            visible = set(order)
+            for key, iid in list(cache.items.items()):
+                if iid not in visible:
+                    del cache.items[key]
+                    del cache.players[iid]
+                    cache.free.append(iid)
+
+        # 並び順の反映と不要な行の切り離しを1回で行う
+        if order != cache.order:
+            tree.set_children("", *order)
+            cache.order = order
+
     def handle_event(self, event: GameEvent) -> None:
         """イベントハンドラ"""
-        try:
-            handlers = {
-                EventType.GAME_STATE_RESET: self._handle_game_reset,
-                EventType.PLAYER_ROLE_ASSIGNED: self._handle_role_assigned,
-                EventType.PLAYER_DIED: self._handle_player_death,
-                EventType.GAME_STATE_UPDATED: self._handle_game_state_update,
-                EventType.ERROR: self._handle_error,
-            }
-
-            handler = handlers.get(event.type)
-            if handler:
-                handler(event)
-                self.state.last_update = datetime.now()
+        # イベントデータは発行側で検証済みのため、例外処理はハンドラ呼び出しのみに限定
+        handler = self._event_handlers.get(event.type)
+        if handler is None:
+            return
 
+        try:
+            handler(event)
+            self.state.last_update_ts = time.monotonic()
         except Exception as e:
             self.logger.error(f"Error handling event {event.type}: {str(e)}")
             self._show_error("イベント処理中にエラーが発生しました。")
@@ -495,7 +700,7 @@ class ParticipantListWindow:
                 self.confirm_button.config(state="normal")
 
             self._enable_context_menus()
-            self._update_trees()
+            self._schedule_tree_update()
             self.logger.info("Reset participant list view")
 
         except Exception as e:
@@ -506,29 +711,32 @@ class ParticipantListWindow:
         player_name = event.data.get("player_name")
         role = event.data.get("role")
 
-        for player in self.state.participants:
-            if player.name == player_name:
-                player.role = PlayerRole(role)
-                break
+        player = self._by_name.get(player_name)
+        if not player:
+            return
 
-        self._update_trees()
+        player.role = PlayerRole(role)
+        if self._is_row_stale(player):
+            self._schedule_tree_update()
         self.logger.info(f"Updated view for role assignment: {player_name}")
 
     def _handle_player_death(self, event: GameEvent) -> None:
         """プレイヤー死亡の処理"""
         player_name = event.data.get("player_name")
-        for player in self.state.participants:
-            if player.name == player_name:
-                player.is_alive = False
-                break
+        player = self._by_name.get(player_name)
+        if not player:
+            return
 
-        self._update_trees()
+        player.is_alive = False
+        if self._is_row_stale(player):
+            self._schedule_tree_update()
         self.logger.info(f"Updated view for player death: {player_name}")
 
     def _handle_game_state_update(self, event: GameEvent) -> None:
         """ゲーム状態更新の処理"""
         self._sync_with_game_state()
-        self._update_trees()
+        if any(self._is_row_stale(player) for player in self.state.participants):
+            self._schedule_tree_update()
         self.logger.info("Updated view from game state")
 
     def _handle_error(self, event: GameEvent) -> None:
@@ -566,15 +774,21 @@ class ParticipantListWindow:
 
     def _disable_context_menus(self) -> None:
         """コンテキストメニューの無効化"""
-        for menu in self.context_menus.values():
-            for index in range(menu.index("end") + 1):
-                menu.entryconfigure(index, state="disabled")
+        self._set_context_menus_state("disabled")
 
     def _enable_context_menus(self) -> None:
         """コンテキストメニューの有効化"""
-        for menu in self.context_menus.values():
-            for index in range(menu.index("end") + 1):
-                menu.entryconfigure(index, state="normal")
+        self._set_context_menus_state("normal")
+
+    def _set_context_menus_state(self, state: str) -> None:
+        """コンテキストメニュー項目の状態を一括設定"""
+        if self._menu_state == state:
+            return
+
+        for key, menu in self.context_menus.items():
+            for index in range(self._menu_entry_counts[key]):
+                menu.entryconfigure(index, state=state)
+        self._menu_state = state
 
     def show(self) -> None:
         """ウィンドウを表示"""
@@ -589,20 +803,38 @@ class ParticipantListWindow:
         """ウィンドウの破棄"""
         try:
             if hasattr(self, "window"):
-                self.window.destroy()
+                # 破棄済みウィジェットへのイベント配信を防ぐため先に登録解除
                 event_manager.unsubscribe_all(self)
+
+                # 予約済みのコールバックを取り消す
+                if self._after_id is not None:
+                    self.window.after_cancel(self._after_id)
+                    self._after_id = None
+                for after_id in self._resize_after_ids.values():
+                    self.window.after_cancel(after_id)
+                self._resize_after_ids.clear()
+
+                self.window.destroy()
+
+                # プレイヤーへの参照を解放
+                self._participant_rows = TreeRowCache()
+                self._non_participant_rows = TreeRowCache()
+                self._sorted_participants = None
+                self._sorted_non_participants = None
+                self._by_name.clear()
+                self._by_key.clear()
+                self._list_indices.clear()
+                self._edit_target = None
         except Exception as e:
             self.logger.error(f"Error destroying window: {str(e)}")
 
     def _on_tree_click(self, event: tk.Event) -> None:
         """ツリーのクリックイベントハンドラ"""
-        try:
-            tree = event.widget
-            item = tree.identify_row(event.y)
-            if item:
-                tree.selection_set(item)
-        except Exception as e:
-            self.logger.error(f"Error handling tree click: {str(e)}")
+        # 行のない位置では identify_row が空文字を返す
+        tree = event.widget
+        item = tree.identify_row(event.y)
+        if item:
+            tree.selection_set(item)
 
     def _show_help(self) -> None:
         """ヘルプダイアログの表示"""
@@ -645,83 +877,97 @@ class ParticipantListWindow:
                 self._show_error("編集するプレイヤーを選択してください。")
                 return
 
-            # 現在の値を取得
-            item = tree.selection()[0]
-            current_values = tree.item(item)["values"]
-            if not current_values:
+            # 選択行のプレイヤーを取得
+            player = self._get_row_cache(tree).players.get(tree.selection()[0])
+            if not player:
                 return
 
-            # 編集ダイアログの作成
-            dialog = tk.Toplevel(self.window)
-            dialog.title("プレイヤー編集")
-            dialog.geometry("300x150")
-            dialog.transient(self.window)
-            dialog.grab_set()
-
-            ttk.Label(dialog, text="番号:").grid(row=0, column=0, padx=5, pady=5)
-            number_var = tk.StringVar(value=str(current_values[0]))
-            number_entry = ttk.Entry(dialog, textvariable=number_var)
-            number_entry.grid(row=0, column=1, padx=5, pady=5)
-
-            ttk.Label(dialog, text="名前:").grid(row=1, column=0, padx=5, pady=5)
-            name_var = tk.StringVar(value=current_values[1])
-            name_entry = ttk.Entry(dialog, textvariable=name_var)
-            name_entry.grid(row=1, column=1, padx=5, pady=5)
-
-            def validate_and_update():
-                try:
-                    new_number = int(number_var.get())
-                    new_name = name_var.get().strip()
-
-                    if not new_name:
-                        raise ValueError("名前を入力してください。")
-
-                    # プレイヤーの更新
-                    players = (
-                        self.state.participants
-                        if tree == self.participant_tree
-                        else self.state.non_participants
-                    )
-                    player = self._find_player_by_values(
-                        current_values,
-                        (
-                            "to_non_participant"
-                            if tree == self.participant_tree
-                            else "to_participant"
-                        ),
-                    )
+            # ダイアログは初回のみ作成し、以降は再表示して使い回す
+            if self._edit_dialog is None:
+                self._create_edit_dialog()
 
-                    if player:
-                        player.number = new_number
-                        player.name = new_name
-                        self._update_trees()
-
-                        # イベント通知
-                        event_manager.notify(
-                            GameEvent(
-                                type=EventType.PLAYER_UPDATED,
-                                data={
-                                    "old_number": current_values[0],
-                                    "old_name": current_values[1],
-                                    "new_number": new_number,
-                                    "new_name": new_name,
-                                },
-                                source="participant_list",
-                            )
-                        )
-
-                    dialog.destroy()
-
-                except ValueError as e:
-                    self._show_error(str(e))
-                except Exception as e:
-                    self.logger.error(f"Error updating player: {str(e)}")
-                    self._show_error("プレイヤーの更新中にエラーが発生しました。")
-
-            ttk.Button(dialog, text="更新", command=validate_and_update).grid(
-                row=2, column=0, columnspan=2, pady=20
-            )
+            self._edit_target = player
+            self._edit_number_var.set(str(player.number))
+            self._edit_name_var.set(player.name)
+            self._edit_dialog.deiconify()
+            self._edit_dialog.grab_set()
 
         except Exception as e:
             self.logger.error(f"Error showing edit dialog: {str(e)}")
             self._show_error("編集ダイアログの表示中にエラーが発生しました。")
+
+    def _create_edit_dialog(self) -> None:
+        """プレイヤー編集ダイアログの作成"""
+        dialog = tk.Toplevel(self.window)
+        dialog.title("プレイヤー編集")
+        dialog.geometry("300x150")
+        dialog.transient(self.window)
+        dialog.protocol("WM_DELETE_WINDOW", self._close_edit_dialog)
+
+        ttk.Label(dialog, text="番号:").grid(row=0, column=0, padx=5, pady=5)
+        number_var = tk.StringVar()
+        number_entry = ttk.Entry(dialog, textvariable=number_var)
+        number_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(dialog, text="名前:").grid(row=1, column=0, padx=5, pady=5)
+        name_var = tk.StringVar()
+        name_entry = ttk.Entry(dialog, textvariable=name_var)
+        name_entry.grid(row=1, column=1, padx=5, pady=5)
+
+        ttk.Button(dialog, text="更新", command=self._apply_player_edit).grid(
+            row=2, column=0, columnspan=2, pady=20
+        )
+
+        self._edit_dialog = dialog
+        self._edit_number_var = number_var
+        self._edit_name_var = name_var
+
+    def _close_edit_dialog(self) -> None:
+        """編集ダイアログを閉じる（破棄せず非表示にする）"""
+        self._edit_target = None
+        self._edit_dialog.grab_release()
+        self._edit_dialog.withdraw()
+
+    def _apply_player_edit(self) -> None:
+        """編集内容の反映"""
+        player = self._edit_target
+        if player is None:
+            return
+
+        try:
+            new_number = int(self._edit_number_var.get())
+            new_name = self._edit_name_var.get().strip()
+
+            if not new_name:
+                raise ValueError("名前を入力してください。")
+
+            # プレイヤーの更新（リストが読み込み直されていないことを確認）
+            if self._by_key.get((player.number, player.name)) is player:
+                old_number, old_name = player.number, player.name
+                player.number = new_number
+                player.name = new_name
+                self._reindex_player(player, old_number, old_name)
+                self._invalidate_sorted_players()
+                self._update_trees()
+
+                # イベント通知
+                event_manager.notify(
+                    GameEvent(
+                        type=EventType.PLAYER_UPDATED,
+                        data={
+                            "old_number": old_number,
+                            "old_name": old_name,
+                            "new_number": new_number,
+                            "new_name": new_name,
+                        },
+                        source="participant_list",
+                    )
+                )
+
+            self._close_edit_dialog()
+
+        except ValueError as e:
+            self._show_error(str(e))
+        except Exception as e:
+            self.logger.error(f"Error updating player: {str(e)}")
+            self._show_error("プレイヤーの更新中にエラーが発生しました。")
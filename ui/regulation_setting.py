@@ -1,17 +1,14 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Set
 from dataclasses import dataclass, field
-import json
+from contextlib import contextmanager
+from functools import partial
 import logging
 import tkinter as tk
-from tkinter import ttk, messagebox, simpledialog
-from datetime import datetime
-from pathlib import Path
+from tkinter import ttk, messagebox
 
-from config.settings import APP_SETTINGS, ROLE_SETTINGS, DATA_DIR
+from config.settings import APP, ROLE_SETTINGS
 from store.global_data_store import GlobalDataStore
 from core.events import EventType, GameEvent, event_manager
-from core.game_state import GamePhase
-from core.player import PlayerRole
 
 
 @dataclass
@@ -21,7 +18,6 @@ class RegulationState:
     role_counts: Dict[str, int] = field(default_factory=dict)
     round_times: List[Dict[str, int]] = field(default_factory=list)
     is_confirmed: bool = False
-    last_update: datetime = field(default_factory=datetime.now)
     total_players: int = 0
 
 
@@ -33,11 +29,22 @@ class RoundTimeConfig:
     time: int
     frame: ttk.Frame
     time_var: tk.StringVar
+    label: Optional[ttk.Label] = None
+    spinbox: Optional[ttk.Spinbox] = None
+    remove_button: Optional[ttk.Button] = None
 
 
 class RegulationSettingWindow:
     """レギュレーション設定ウィンドウ"""
 
+    # 合計人数の更新を遅延させる時間（ミリ秒）
+    _TOTAL_UPDATE_DELAY_MS = 120
+
+    # 合計人数の表示テンプレート
+    _TOTAL_TEXT = "合計人数: {}"
+    _TOTAL_UNDER_TEXT = f"合計人数: {{}} (最低{APP.min_players}人必要)"
+    _TOTAL_OVER_TEXT = f"合計人数: {{}} (最大{APP.max_players}人まで)"
+
     def __init__(self, parent: tk.Tk, store: GlobalDataStore):
         self.logger = logging.getLogger(__name__)
 
@@ -47,20 +54,32 @@ class RegulationSettingWindow:
         self.window = tk.Toplevel(parent)
         self.window.title("レギュレーション設定")
         self.window.geometry(
-            f"{APP_SETTINGS['default_window_size']['regulation'][0]}x"
-            f"{APP_SETTINGS['default_window_size']['regulation'][1]}"
+            f"{APP.default_window_size['regulation'][0]}x"
+            f"{APP.default_window_size['regulation'][1]}"
         )
 
         # 状態管理
         self.state = RegulationState()
-        self.state.role_counts = {role_id: 0 for role_id in ROLE_SETTINGS.keys()}
+        self.state.role_counts = dict.fromkeys(ROLE_SETTINGS, 0)
 
         # UI要素の参照
         self.role_spinboxes: Dict[str, ttk.Spinbox] = {}
+        self._role_vars: Dict[str, tk.StringVar] = {}
+        self._invalid_roles: Set[str] = set()  # 数値として読めない入力のある役職
         self.total_label: Optional[ttk.Label] = None
         self.round_frame: Optional[ttk.Frame] = None
         self.round_configs: List[RoundTimeConfig] = []
 
+        # 合計人数更新の遅延実行用
+        self._total_after_id: Optional[str] = None
+        self._bulk_update = False  # 一括変更中は合計人数の表示更新を保留
+
+        # イベントハンドラの対応表
+        self._event_handlers = {
+            EventType.GAME_STATE_RESET: self._handle_game_reset,
+            EventType.ERROR: self._handle_error,
+        }
+
         # UIの初期化
         self._init_ui()
 
@@ -87,33 +106,42 @@ class RegulationSettingWindow:
 
     def _create_role_section(self, parent: ttk.Frame) -> None:
         """役職設定セクションの作成"""
+        # 中身をすべて作成してから配置し、親の再レイアウトを1回にまとめる
         role_frame = ttk.LabelFrame(parent, text="役職設定", padding="5")
-        role_frame.pack(fill="x", pady=5)
 
         # 合計人数表示
-        self.total_label = ttk.Label(role_frame, text="合計人数: 0")
+        self.total_label = ttk.Label(role_frame, text=self._TOTAL_TEXT.format(0))
         self.total_label.pack(side="bottom", pady=5)
 
         # 役職ごとの設定行を作成
-        for role_id in ROLE_SETTINGS:
+        max_players = APP.max_players
+        for role_id, role_setting in ROLE_SETTINGS.items():
             frame = ttk.Frame(role_frame)
             frame.pack(fill="x", pady=2)
 
-            ttk.Label(frame, text=f"{ROLE_SETTINGS[role_id]['name']}:").pack(
-                side="left", padx=5
+            ttk.Label(frame, text=f"{role_setting['name']}:").pack(side="left", padx=5)
+
+            # 値の変更は矢印操作・直接入力ともに変数の書き込みとして検知する
+            # 入力文字列をそのまま受け取り、int() で厳密に解釈する
+            # （IntVar は "2.5" などの小数を切り捨てて受け付けてしまう）
+            role_var = tk.StringVar(value="0")
+            role_var.trace_add(
+                "write", lambda *args, r=role_id: self._on_role_changed(r)
             )
 
             spinbox = ttk.Spinbox(
                 frame,
                 from_=0,
-                to=APP_SETTINGS["max_players"],
+                to=max_players,
                 width=5,
-                command=self._update_total_count,
+                textvariable=role_var,
             )
-            spinbox.set("0")
             spinbox.pack(side="right", padx=5)
 
             self.role_spinboxes[role_id] = spinbox
+            self._role_vars[role_id] = role_var
+
+        role_frame.pack(fill="x", pady=5)
 
     def _create_timer_section(self, parent: ttk.Frame) -> None:
         """タイマー設定セクションの作成"""
@@ -161,7 +189,8 @@ class RegulationSettingWindow:
         frame = ttk.Frame(self.round_frame)
         frame.pack(fill="x", pady=2)
 
-        ttk.Label(frame, text=f"{round_num}R:").pack(side="left", padx=5)
+        label = ttk.Label(frame, text=f"{round_num}R:")
+        label.pack(side="left", padx=5)
 
         time_var = tk.StringVar(value=default_time)
         spinbox = ttk.Spinbox(frame, from_=1, to=60, width=5, textvariable=time_var)
@@ -169,39 +198,39 @@ class RegulationSettingWindow:
 
         ttk.Label(frame, text="分").pack(side="left")
 
-        # 削除ボタン（最初のラウンド以外）
-        if round_num > 1:
-            ttk.Button(
-                frame,
-                text="削除",
-                command=lambda f=frame, r=round_num: self._remove_round(f, r),
-            ).pack(side="right", padx=5)
-
         # 設定の保存
         config = RoundTimeConfig(
             round_number=round_num,
             time=int(default_time),
             frame=frame,
             time_var=time_var,
+            label=label,
+            spinbox=spinbox,
         )
         self.round_configs.append(config)
 
+        # 削除ボタン（最初のラウンド以外）
+        # 番号は振り直されるため、押された時点の番号を参照する
+        if round_num > 1:
+            config.remove_button = ttk.Button(
+                frame,
+                text="削除",
+                command=lambda c=config: self._remove_round(c.frame, c.round_number),
+            )
+            config.remove_button.pack(side="right", padx=5)
+
     def _remove_round(self, frame: ttk.Frame, round_num: int) -> None:
         """ラウンドの削除"""
         try:
             frame.destroy()
-            self.round_configs = [
-                config
-                for config in self.round_configs
-                if config.round_number != round_num
-            ]
+            # ラウンド番号は常に並び順と一致しているため位置で削除できる
+            self.round_configs.pop(round_num - 1)
 
-            # ラウンド番号の振り直し
-            for i, config in enumerate(self.round_configs, 1):
-                config.round_number = i
-                for widget in config.frame.winfo_children():
-                    if isinstance(widget, ttk.Label) and "R:" in widget.cget("text"):
-                        widget.config(text=f"{i}R:")
+            # ラウンド番号の振り直し（削除位置以降のみ）
+            for i, config in enumerate(self.round_configs[round_num - 1 :], round_num):
+                if config.round_number != i:
+                    config.round_number = i
+                    config.label.config(text=f"{i}R:")
 
             self.logger.info(f"Removed round {round_num}")
 
@@ -209,41 +238,73 @@ class RegulationSettingWindow:
             self.logger.error(f"Error removing round: {str(e)}")
             self._show_error("ラウンドの削除中にエラーが発生しました。")
 
+    def _on_role_changed(self, role_id: str) -> None:
+        """役職人数の変更を合計人数に差分で反映"""
+        try:
+            count = int(self._role_vars[role_id].get())
+        except ValueError:
+            self._invalid_roles.add(role_id)
+        else:
+            self._invalid_roles.discard(role_id)
+            self.state.total_players += count - self.state.role_counts[role_id]
+            self.state.role_counts[role_id] = count
+
+        if not self._bulk_update:
+            self._schedule_total_count_update()
+
+    @contextmanager
+    def _suspend_updates(self) -> Iterator[None]:
+        """一括変更の間は表示更新を止め、終了時に1回だけ反映"""
+        self._bulk_update = True
+        try:
+            yield
+        finally:
+            self._bulk_update = False
+            self._update_total_count()
+
+    def _schedule_total_count_update(self) -> None:
+        """合計人数の更新を予約（連続した操作はまとめて最後に1回だけ処理）"""
+        if self._total_after_id is not None:
+            self.window.after_cancel(self._total_after_id)
+        self._total_after_id = self.window.after(
+            self._TOTAL_UPDATE_DELAY_MS, self._update_total_count
+        )
+
     def _update_total_count(self) -> None:
         """合計人数の更新"""
-        try:
-            total = sum(int(spinbox.get()) for spinbox in self.role_spinboxes.values())
-            self.state.total_players = total
+        if self._total_after_id is not None:
+            self.window.after_cancel(self._total_after_id)
+            self._total_after_id = None
 
-            if hasattr(self, "total_label"):
-                self.total_label.config(text=f"合計人数: {total}")
+        try:
+            if self._invalid_roles:
+                self.logger.warning("Invalid number input detected")
+                self.total_label.config(text="合計人数: 無効な入力")
+                return
 
-            self._validate_total_players(total)
+            self.total_label.config(
+                text=self._format_total_players(self.state.total_players)
+            )
 
-        except ValueError:
-            self.logger.warning("Invalid number input detected")
-            self.total_label.config(text="合計人数: 無効な入力")
         except Exception as e:
             self.logger.error(f"Error updating total count: {str(e)}")
 
-    def _validate_total_players(self, total: int) -> None:
-        """プレイヤー数の検証"""
-        if total < APP_SETTINGS["min_players"]:
-            self.total_label.config(
-                text=f"合計人数: {total} (最低{APP_SETTINGS['min_players']}人必要)"
-            )
-        elif total > APP_SETTINGS["max_players"]:
-            self.total_label.config(
-                text=f"合計人数: {total} (最大{APP_SETTINGS['max_players']}人まで)"
-            )
+    def _format_total_players(self, total: int) -> str:
+        """合計人数の表示文字列（範囲外の場合は注意書きを付ける）"""
+        if total < APP.min_players:
+            return self._TOTAL_UNDER_TEXT.format(total)
+        if total > APP.max_players:
+            return self._TOTAL_OVER_TEXT.format(total)
+        return self._TOTAL_TEXT.format(total)
 
     def _create_regulation_data(self) -> Dict:
         """レギュレーションデータの作成"""
+        if self._invalid_roles:
+            raise ValueError("役職人数に無効な入力があります。")
+
+        # 役職人数は変更時に記録済みの値を使う（ウィジェットへの問い合わせ不要）
         return {
-            "roles": {
-                role_id: int(spinbox.get())
-                for role_id, spinbox in self.role_spinboxes.items()
-            },
+            "roles": dict(self.state.role_counts),
             "round_times": [
                 {"round": config.round_number, "time": int(config.time_var.get())}
                 for config in self.round_configs
@@ -253,6 +314,9 @@ class RegulationSettingWindow:
 
     def _save_regulation(self) -> None:
         """レギュレーションの保存"""
+        # 保存時にしか使わないため、ここで読み込む
+        from tkinter import simpledialog
+
         try:
             name = simpledialog.askstring(
                 "保存", "レギュレーション名を入力してください:", parent=self.window
@@ -262,8 +326,9 @@ class RegulationSettingWindow:
                 return
 
             regulation_data = self._create_regulation_data()
-            if not self._validate_regulation_data(regulation_data):
-                self._show_error("無効なレギュレーションデータです。")
+            errors = self._validate_regulation_data(regulation_data)
+            if errors:
+                self._show_error("\n".join(errors))
                 return
 
             if self.store.save_regulation(name, regulation_data):
@@ -295,11 +360,51 @@ class RegulationSettingWindow:
             dialog.title("保存済みレギュレーション")
             dialog.geometry("300x400")
 
-            list_box = tk.Listbox(dialog)
-            list_box.pack(fill="both", expand=True, padx=5, pady=5)
+            tree = ttk.Treeview(
+                dialog, columns=("players", "rounds"), show="tree headings"
+            )
+            tree.heading("#0", text="名前")
+            tree.heading("players", text="人数")
+            tree.heading("rounds", text="ラウンド数")
+            tree.column("#0", width=150)
+            tree.column("players", width=60, anchor="center")
+            tree.column("rounds", width=70, anchor="center")
+            tree.pack(fill="both", expand=True, padx=5, pady=5)
+
+            # 行IDにはレギュレーション名を使う
+            for name in self.store.regulation_names():
+                regulation = regulations[name]
+                tree.insert(
+                    "",
+                    tk.END,
+                    iid=name,
+                    text=name,
+                    values=(
+                        regulation.get("total_players", 0),
+                        len(regulation.get("round_times", [])),
+                    ),
+                )
+
+            # 見出しクリックで並べ替え（行は作り直さず移動のみ）
+            sort_keys = {
+                "#0": lambda name: name,
+                "players": lambda name: regulations[name].get("total_players", 0),
+                "rounds": lambda name: len(regulations[name].get("round_times", [])),
+            }
+            descending = {column: False for column in sort_keys}
 
-            for name in sorted(regulations.keys()):
-                list_box.insert(tk.END, name)
+            def sort_by(column: str) -> None:
+                names = sorted(
+                    tree.get_children(),
+                    key=sort_keys[column],
+                    reverse=descending[column],
+                )
+                for index, name in enumerate(names):
+                    tree.move(name, "", index)
+                descending[column] = not descending[column]
+
+            for column in sort_keys:
+                tree.heading(column, command=partial(sort_by, column))
 
             button_frame = ttk.Frame(dialog)
             button_frame.pack(fill="x", padx=5, pady=5)
@@ -308,7 +413,7 @@ class RegulationSettingWindow:
                 button_frame,
                 text="読み込み",
                 command=lambda: self._load_selected_regulation(
-                    list_box, dialog, regulations
+                    tree, dialog, regulations
                 ),
             ).pack(side="left", padx=5)
 
@@ -321,23 +426,25 @@ class RegulationSettingWindow:
             self._show_error("保存済みレギュレーションの表示中にエラーが発生しました。")
 
     def _load_selected_regulation(
-        self, list_box: tk.Listbox, dialog: tk.Toplevel, regulations: Dict
+        self, tree: ttk.Treeview, dialog: tk.Toplevel, regulations: Dict
     ) -> None:
         """選択されたレギュレーションの読み込み"""
         try:
-            selection = list_box.curselection()
+            selection = tree.selection()
             if not selection:
                 return
 
-            name = list_box.get(selection[0])
+            name = selection[0]
             regulation_data = regulations[name]
 
-            if self._validate_regulation_data(regulation_data):
-                self._load_regulation(regulation_data)
-                dialog.destroy()
-                self.logger.info(f"Loaded regulation: {name}")
-            else:
-                raise ValueError("無効なレギュレーションデータです。")
+            errors = self._validate_regulation_data(regulation_data)
+            if errors:
+                self._show_error("\n".join(errors))
+                return
+
+            self._load_regulation(regulation_data)
+            dialog.destroy()
+            self.logger.info(f"Loaded regulation: {name}")
 
         except Exception as e:
             self.logger.error(f"Error loading regulation: {str(e)}")
@@ -346,18 +453,17 @@ class RegulationSettingWindow:
     def _load_regulation(self, regulation_data: Dict) -> None:
         """レギュレーションの読み込み"""
         try:
-            # 役職人数の設定
-            for role_id, count in regulation_data["roles"].items():
-                if role_id in self.role_spinboxes:
-                    self.role_spinboxes[role_id].set(str(count))
-
-            self._update_total_count()
-
-            # ラウンド時間の設定
-            self._clear_rounds()
-            for round_time in regulation_data["round_times"]:
-                self._add_round()
-                self.round_configs[-1].time_var.set(str(round_time["time"]))
+            with self._suspend_updates():
+                # 役職人数の設定
+                for role_id, count in regulation_data["roles"].items():
+                    if role_id in self._role_vars:
+                        self._role_vars[role_id].set(count)
+
+                # ラウンド時間の設定
+                self._clear_rounds()
+                for round_time in regulation_data["round_times"]:
+                    self._add_round()
+                    self.round_configs[-1].time_var.set(str(round_time["time"]))
 
             event_manager.notify(
                 GameEvent(
@@ -373,8 +479,11 @@ class RegulationSettingWindow:
 
     def _clear_rounds(self) -> None:
         """ラウンド設定のクリア"""
-        for config in self.round_configs:
-            config.frame.destroy()
+        # 行ごとに破棄せず、コンテナごと差し替えて再配置を1回にまとめる
+        old_frame = self.round_frame
+        self.round_frame = ttk.Frame(old_frame.master)
+        self.round_frame.pack(fill="x", before=old_frame)
+        old_frame.destroy()
         self.round_configs.clear()
 
     def _confirm_regulation(self) -> None:
@@ -382,7 +491,10 @@ class RegulationSettingWindow:
         try:
             regulation_data = self._create_regulation_data()
 
-            if not self._validate_regulation_data(regulation_data):
+            # エラーはまとめて1回だけ表示する
+            errors = self._validate_regulation_data(regulation_data)
+            if errors:
+                self._show_error("\n".join(errors))
                 return
 
             if not messagebox.askyesno(
@@ -414,84 +526,62 @@ class RegulationSettingWindow:
             self.logger.error(f"Error confirming regulation: {str(e)}")
             self._show_error("レギュレーションの確定中にエラーが発生しました。")
 
-    def _validate_regulation_data(self, regulation: Dict) -> bool:
-        """レギュレーションデータの検証"""
+    def _validate_regulation_data(self, regulation: Dict) -> List[str]:
+        """レギュレーションデータの検証（エラーメッセージの一覧を返す）"""
         try:
             total_players = regulation["total_players"]
+            min_players = APP.min_players
+            max_players = APP.max_players
 
-            if total_players < APP_SETTINGS["min_players"]:
-                self._show_error(
-                    f"最低{APP_SETTINGS['min_players']}人のプレイヤーが必要です。"
-                )
-                return False
-
-            if total_players > APP_SETTINGS["max_players"]:
-                self._show_error(
-                    f"最大{APP_SETTINGS['max_players']}人までしか設定できません。"
-                )
-                return False
-
-            # 役職の検証
-            if not self._validate_roles(regulation["roles"]):
-                return False
+            # 人数が範囲外なら以降の検証は行わない
+            if total_players < min_players:
+                return [f"最低{min_players}人のプレイヤーが必要です。"]
 
-            # ラウンド時間の検証
-            if not self._validate_round_times(regulation["round_times"]):
-                return False
+            if total_players > max_players:
+                return [f"最大{max_players}人までしか設定できません。"]
 
-            return True
+            # 役職とラウンド時間の検証
+            errors = self._validate_roles(regulation["roles"], total_players)
+            errors.extend(self._validate_round_times(regulation["round_times"]))
+            return errors
 
         except Exception as e:
             self.logger.error(f"Error validating regulation: {str(e)}")
-            return False
+            return ["無効なレギュレーションデータです。"]
 
-    def _validate_roles(self, roles: Dict[str, int]) -> bool:
+    def _validate_roles(self, roles: Dict[str, int], total: int) -> List[str]:
         """役職設定の検証"""
-        try:
-            # 必須役職のチェック
-            if roles.get("werewolf", 0) == 0:
-                self._show_error("人狼は最低1人必要です。")
-                return False
-
-            if roles.get("villager", 0) == 0:
-                self._show_error("村人は最低1人必要です。")
-                return False
+        errors = []
 
-            # 役職バランスのチェック
-            werewolf_count = roles.get("werewolf", 0)
-            total_count = sum(roles.values())
+        # 必須役職のチェック
+        werewolf_count = roles.get("werewolf", 0)
+        if werewolf_count == 0:
+            errors.append("人狼は最低1人必要です。")
 
-            if werewolf_count >= total_count / 2:
-                self._show_error("人狼の数が多すぎます。")
-                return False
+        villager_count = roles.get("villager", 0)
+        if villager_count == 0:
+            errors.append("村人は最低1人必要です。")
 
-            return True
+        # 役職バランスのチェック（合計人数は呼び出し元で集計済み）
+        if werewolf_count and werewolf_count * 2 >= total:
+            errors.append("人狼の数が多すぎます。")
 
-        except Exception as e:
-            self.logger.error(f"Error validating roles: {str(e)}")
-            return False
+        return errors
 
-    def _validate_round_times(self, round_times: List[Dict]) -> bool:
+    def _validate_round_times(self, round_times: List[Dict]) -> List[str]:
         """ラウンド時間設定の検証"""
-        try:
-            if not round_times:
-                self._show_error("最低1ラウンドの設定が必要です。")
-                return False
+        if not round_times:
+            return ["最低1ラウンドの設定が必要です。"]
 
-            for round_time in round_times:
-                if not isinstance(round_time.get("time"), int):
-                    self._show_error("無効なラウンド時間設定です。")
-                    return False
+        # 最初に見つかった不正なラウンドのみ報告する
+        for round_time in round_times:
+            if not isinstance(round_time.get("time"), int):
+                return ["無効なラウンド時間設定です。"]
 
-                if round_time["time"] < 1 or round_time["time"] > 60:
-                    self._show_error("ラウンド時間は1〜60分の間で設定してください。")
-                    return False
+            if round_time["time"] < 1 or round_time["time"] > 60:
+                return ["ラウンド時間は1〜60分の間で設定してください。"]
 
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Error validating round times: {str(e)}")
-            return False
+        return []
 
     def _disable_inputs(self) -> None:
         """入力要素の無効化"""
@@ -500,28 +590,26 @@ class RegulationSettingWindow:
                 spinbox.config(state="disabled")
 
             for config in self.round_configs:
-                for child in config.frame.winfo_children():
-                    if isinstance(child, (ttk.Spinbox, ttk.Button)):
-                        child.config(state="disabled")
+                config.spinbox.config(state="disabled")
+                if config.remove_button is not None:
+                    config.remove_button.config(state="disabled")
 
         except Exception as e:
             self.logger.error(f"Error disabling inputs: {str(e)}")
 
     def handle_event(self, event: GameEvent) -> None:
         """イベントハンドラ"""
+        # 対象外のイベントはウィンドウの確認より先に除外
+        handler = self._event_handlers.get(event.type)
+        if handler is None:
+            return
+
         try:
             # ウィンドウが存在しない場合は処理をスキップ
             if not hasattr(self, "window") or not self.window.winfo_exists():
                 return
 
-            handlers = {
-                EventType.GAME_STATE_RESET: self._handle_game_reset,
-                EventType.ERROR: self._handle_error,
-            }
-
-            handler = handlers.get(event.type)
-            if handler:
-                handler(event)
+            handler(event)
 
         except Exception as e:
             self.logger.error(f"Error handling event {event.type}: {str(e)}")
@@ -529,12 +617,8 @@ class RegulationSettingWindow:
 
     def _handle_game_reset(self, event: GameEvent) -> None:
         """ゲームリセットの処理"""
+        # ウィンドウの存在は handle_event で確認済み
         try:
-            # ウィンドウが存在しない場合は処理をスキップ
-            if not hasattr(self, "window") or not self.window.winfo_exists():
-                return
-
-            # UIコンポーネントの存在確認をしてから処理
             self._reset_ui_state()
             self.logger.info("Reset regulation setting view")
 
@@ -556,6 +640,9 @@ class RegulationSettingWindow:
         """ウィンドウの破棄"""
         try:
             if hasattr(self, "window"):
+                if self._total_after_id is not None:
+                    self.window.after_cancel(self._total_after_id)
+                    self._total_after_id = None
                 self.window.destroy()
                 event_manager.unsubscribe_all(self)
         except Exception as e:
@@ -567,18 +654,17 @@ class RegulationSettingWindow:
             # 確定状態の解除
             self.state.is_confirmed = False
 
-            # 役職設定の有効化
-            for spinbox in self.role_spinboxes.values():
-                if spinbox.winfo_exists():
-                    spinbox.config(state="normal")
-                    spinbox.set("0")
-
-            # ラウンド設定のリセット
-            self._clear_rounds()
-            self._add_round()  # 初期ラウンドを追加
-
-            # 合計人数の更新
-            self._update_total_count()
+            # 合計人数の表示は一括変更の終了時に更新
+            with self._suspend_updates():
+                # 役職設定の有効化
+                for role_id, spinbox in self.role_spinboxes.items():
+                    if spinbox.winfo_exists():
+                        spinbox.config(state="normal")
+                        self._role_vars[role_id].set(0)
+
+                # ラウンド設定のリセット
+                self._clear_rounds()
+                self._add_round()  # 初期ラウンドを追加
 
             self.logger.info("Regulation setting UI reset successfully")
 
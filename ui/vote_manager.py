@@ -1,5 +1,6 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
@@ -12,7 +13,7 @@ from core.game_state import GamePhase
 from core.player import Player
 
 
-@dataclass
+@dataclass(slots=True)
 class VoteStatus:
     """投票状態を管理するデータクラス"""
 
@@ -23,6 +24,16 @@ class VoteStatus:
 
 
 @dataclass
+class VoteRowWidgets:
+    """プレイヤー行のウィジェットをまとめるデータクラス（行は使い回す）"""
+
+    button: ttk.Checkbutton  # 番号と名前を表示する投票チェックボックス
+    var: tk.BooleanVar
+    player: Optional[Player] = None  # 表示中のプレイヤー（未使用ならNone）
+    shown: Optional[Tuple[int, str]] = None  # 表示中の(番号, 名前)
+
+
+@dataclass(slots=True)
 class VoteManagerState:
     """投票管理の状態を管理するデータクラス"""
 
@@ -30,12 +41,59 @@ class VoteManagerState:
     phase: GamePhase = GamePhase.SETUP
     round: int = 0
     is_voting_complete: bool = False
+    unvoted_count: int = 0  # 未投票者数（投票状態の変更時に増減）
     last_update: datetime = field(default_factory=datetime.now)
 
 
+class _LazyVoteSummary(Mapping):
+    """投票結果のサマリー（中身は最初に参照されたときに作成する）"""
+
+    def __init__(self, statuses: Dict[str, VoteStatus]):
+        # 後の投票リセットの影響を受けないよう、通知時点の値を控えておく
+        self._entries = [
+            (name, status.vote_time, status.vote_target)
+            for name, status in statuses.items()
+        ]
+        self._summary: Optional[Dict[str, Dict]] = None
+
+    def _get_summary(self) -> Dict[str, Dict]:
+        if self._summary is None:
+            self._summary = {
+                name: {
+                    "vote_time": vote_time.isoformat() if vote_time else None,
+                    "vote_target": vote_target,
+                }
+                for name, vote_time, vote_target in self._entries
+            }
+        return self._summary
+
+    def __getitem__(self, key: str) -> Dict:
+        return self._get_summary()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_summary())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class VoteManagerWindow:
     """投票管理ウィンドウ"""
 
+    # 連続した更新をまとめて再描画するまでの時間（ミリ秒）
+    _REDRAW_DELAY_MS = 50
+
+    # プレイヤー番号の表示形式（str.format を束縛して使い回す）
+    _format_number = "[{:>3}]".format
+
+    # イベントタイプとハンドラ名の対応表
+    _EVENT_HANDLERS = {
+        EventType.PLAYER_DIED: "_handle_player_death",
+        EventType.PHASE_CHANGED: "_handle_phase_change",
+        EventType.GAME_STATE_UPDATED: "_handle_game_state_update",
+        EventType.ERROR: "_handle_error",
+    }
+
     def __init__(self, parent: tk.Tk, store: GlobalDataStore):
         self.logger = logging.getLogger(__name__)
 
@@ -54,8 +112,30 @@ class VoteManagerWindow:
 
         # UI要素の参照
         self.remaining_votes_label: Optional[ttk.Label] = None
+        self._last_label_text: Optional[str] = None  # ラベルに設定済みの文字
+        self._last_label_fg: Optional[str] = None  # ラベルに設定済みの色
         self.scrollable_frame: Optional[ttk.Frame] = None
+        self._canvas: Optional[tk.Canvas] = None
+        self._wheel_bound = False  # マウスホイールを自分に割り当て中か
         self.vote_vars: Dict[str, tk.BooleanVar] = {}
+        self._rows: Dict[str, VoteRowWidgets] = {}  # プレイヤー名 -> 表示中の行
+        self._free_rows: List[VoteRowWidgets] = []  # 再利用可能な非表示の行
+        self._row_order: List[str] = []  # 表示中の行の並び（プレイヤー名）
+        self._rows_by_var: Dict[str, VoteRowWidgets] = {}  # 変数名 -> 行
+
+        # 生存者リストのキャッシュ（ゲーム状態の更新番号が変わるまで再利用）
+        self._alive_cache_key: Optional[Tuple[int, int]] = None
+        self._alive_cache: List[Player] = []
+        self._statuses_key: Optional[Tuple[int, int]] = None  # 投票状態の作成元
+
+        # 再描画の遅延実行用
+        self._redraw_after_id: Optional[str] = None
+
+        # 同じイベント処理中に共有する現在時刻
+        self._cached_now: Optional[datetime] = None
+
+        # 一括更新中は投票変更イベントを発行しない
+        self._suppress_vote_events = False
 
         # UIの初期化
         self._init_ui()
@@ -72,6 +152,9 @@ class VoteManagerWindow:
         main_frame = ttk.Frame(self.window, padding="10")
         main_frame.pack(expand=True, fill="both")
 
+        # 行ウィジェットのスタイル設定
+        self._setup_row_style()
+
         # 未投票者数表示
         self.remaining_votes_label = ttk.Label(
             main_frame, text="未投票プレイヤー: 0人", font=("Helvetica", 12, "bold")
@@ -81,6 +164,11 @@ class VoteManagerWindow:
         # 生存者リスト表示用フレーム
         self._create_player_list_frame(main_frame)
 
+    def _setup_row_style(self) -> None:
+        """プレイヤー行のスタイル設定（全行で共有）"""
+        style = ttk.Style(self.window)
+        style.configure("Vote.TCheckbutton", font=("Helvetica", 10), padding=0)
+
     def _create_player_list_frame(self, parent: ttk.Frame) -> None:
         """プレイヤーリスト表示フレームの作成"""
         list_frame = ttk.LabelFrame(parent, text="生存者リスト", padding="5")
@@ -102,30 +190,51 @@ class VoteManagerWindow:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # マウスホイールでのスクロール設定
-        canvas.bind_all(
-            "<MouseWheel>",
-            lambda e: canvas.yview_scroll(-1 * (e.delta // 120), "units"),
-        )
+        # マウスホイールはカーソルがリスト上にある間だけ割り当てる
+        self._canvas = canvas
+        canvas.bind("<Enter>", self._bind_mousewheel)
+        canvas.bind("<Leave>", self._unbind_mousewheel)
+
+    def _bind_mousewheel(self, event: tk.Event) -> None:
+        """マウスホイールをリストのスクロールに割り当て"""
+        self._canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self._wheel_bound = True
+
+    def _unbind_mousewheel(self, event: Optional[tk.Event] = None) -> None:
+        """マウスホイールの割り当てを解除（リスト内の行へ移動しただけなら維持）"""
+        if not self._wheel_bound:
+            return
+        if event is not None:
+            widget = self._canvas.winfo_containing(event.x_root, event.y_root)
+            path = str(self._canvas)
+            if widget is not None and (
+                str(widget) == path or str(widget).startswith(path + ".")
+            ):
+                return
+        self._canvas.unbind_all("<MouseWheel>")
+        self._wheel_bound = False
+
+    def _on_mousewheel(self, event: tk.Event) -> None:
+        """マウスホイールによるスクロール"""
+        self._canvas.yview_scroll(-1 * (event.delta // 120), "units")
 
     def _initialize_data(self) -> None:
         """初期データの取得と表示"""
         try:
-            game_state = self.store.game_state
-            alive_players = [
-                player for player in game_state.players.values() if player.is_alive
-            ]
-
-            # 番号でソート
-            alive_players.sort(key=lambda x: x.number)
+            # 生存者が前回から変わっていなければ何もしない
+            alive_players = self._get_alive_players()
+            if self._statuses_key == self._alive_cache_key:
+                return
 
             # 投票状態の初期化
             self.state.vote_statuses = {
                 player.name: VoteStatus(player=player) for player in alive_players
             }
+            self.state.unvoted_count = len(alive_players)
+            self._statuses_key = self._alive_cache_key
 
             # UI更新
-            self._update_player_list()
+            self._schedule_redraw()
             self.logger.info(
                 f"Vote manager initialized with {len(alive_players)} players"
             )
@@ -134,18 +243,68 @@ class VoteManagerWindow:
             self.logger.error(f"Error initializing vote data: {str(e)}")
             self._show_error("データの初期化中にエラーが発生しました。")
 
+    def _get_alive_players(self) -> List[Player]:
+        """番号順の生存者リストを取得（ゲーム状態が更新されたときのみ作り直す）"""
+        game_state = self.store.game_state
+        cache_key = (id(game_state), game_state.version)
+        if cache_key != self._alive_cache_key:
+            self._alive_cache = sorted(
+                (player for player in game_state.players.values() if player.is_alive),
+                key=lambda x: x.number,
+            )
+            self._alive_cache_key = cache_key
+        return self._alive_cache
+
+    def _schedule_redraw(self) -> None:
+        """プレイヤーリストの再描画を予約（短時間の連続した更新は1回にまとめる）"""
+        if self._redraw_after_id is None:
+            self._redraw_after_id = self.window.after(
+                self._REDRAW_DELAY_MS, self._flush_redraw
+            )
+
+    def _flush_redraw(self) -> None:
+        """予約された再描画の実行"""
+        self._redraw_after_id = None
+        self._update_player_list()
+
     def _update_player_list(self) -> None:
         """プレイヤーリストの表示更新"""
         try:
-            # 既存の項目をクリア
-            for widget in self.scrollable_frame.winfo_children():
-                widget.destroy()
-
-            self.vote_vars.clear()
-
-            # プレイヤーごとの表示項目作成
-            for player_name, status in self.state.vote_statuses.items():
-                self._create_player_row(status)
+            statuses = self.state.vote_statuses
+
+            # 表示されなくなった行は破棄せず非表示にして再利用に回す
+            removed = [name for name in self._rows if name not in statuses]
+            for name in removed:
+                row = self._rows.pop(name)
+                row.player = None
+                row.button.pack_forget()
+                self._free_rows.append(row)
+                del self.vote_vars[name]
+
+            # 既存の行はそのまま更新し、新しいプレイヤーにだけ行を割り当てる
+            added = []
+            for name, status in statuses.items():
+                row = self._rows.get(name)
+                if row is None:
+                    row = (
+                        self._free_rows.pop()
+                        if self._free_rows
+                        else self._create_player_row()
+                    )
+                    self._rows[name] = row
+                    self.vote_vars[name] = row.var
+                    added.append(name)
+                self._bind_player_row(row, status)
+
+            # 追加行は末尾に配置されるため、並びが変わった場合のみ詰め直す
+            packed = [name for name in self._row_order if name in statuses] + added
+            order = list(statuses)
+            if packed != order:
+                for name in order:
+                    self._rows[name].button.pack_forget()
+                for name in order:
+                    self._rows[name].button.pack(fill="x", padx=5, pady=2)
+            self._row_order = order
 
             self._update_remaining_votes()
             self.logger.debug("Player list updated in vote manager")
@@ -154,37 +313,61 @@ class VoteManagerWindow:
             self.logger.error(f"Error updating player list: {str(e)}")
             self._show_error("プレイヤーリストの更新中にエラーが発生しました。")
 
-    def _create_player_row(self, status: VoteStatus) -> None:
-        """プレイヤー行の作成"""
-        frame = ttk.Frame(self.scrollable_frame)
-        frame.pack(fill="x", pady=2)
-
-        # 番号とプレイヤー名
-        ttk.Label(frame, text=f"[{status.player.number:>3}]", width=6).pack(
-            side="left", padx=5
+    def _create_player_row(self) -> VoteRowWidgets:
+        """プレイヤー行の作成（表示内容は _bind_player_row で設定）"""
+        # 1行を1つのチェックボックスで表し、番号と名前はそのテキストに表示する
+        # （変更は変数のトレースで _on_vote_trace に集約）
+        var = tk.BooleanVar(value=False)
+        button = ttk.Checkbutton(
+            self.scrollable_frame, variable=var, style="Vote.TCheckbutton"
         )
+        row = VoteRowWidgets(button=button, var=var)
+        var.trace_add("write", self._on_vote_trace)
+        self._rows_by_var[str(var)] = row
+
+        return row
+
+    def _bind_player_row(self, row: VoteRowWidgets, status: VoteStatus) -> None:
+        """行にプレイヤーを割り当てて表示を更新（変更がなければ何もしない）"""
+        player = status.player
+        if row.player is None:
+            row.button.pack(fill="x", padx=5, pady=2)
+        row.player = player
+
+        shown = (player.number, player.name)
+        if row.shown != shown:
+            row.button.config(
+                text=f"{self._format_number(player.number)}  {player.name}"
+            )
+            row.shown = shown
 
-        ttk.Label(frame, text=status.player.name, width=20).pack(side="left", padx=5)
-
-        # 投票チェックボックス
-        var = tk.BooleanVar(value=status.has_voted)
-        self.vote_vars[status.player.name] = var
+        if row.var.get() != status.has_voted:
+            row.var.set(status.has_voted)
 
-        ttk.Checkbutton(
-            frame,
-            variable=var,
-            command=lambda p=status.player: self._handle_vote_change(p),
-        ).pack(side="right", padx=5)
+    def _on_vote_trace(self, var_name: str, *_) -> None:
+        """投票変数の変更通知（変更時点で行に割り当てられているプレイヤーを使う）"""
+        row = self._rows_by_var.get(var_name)
+        if row is not None and row.player is not None:
+            self._handle_vote_change(row.player)
 
     def _handle_vote_change(self, player: Player) -> None:
         """投票状態変更の処理"""
         try:
+            if self._suppress_vote_events:
+                return
+
             var = self.vote_vars[player.name]
             status = self.state.vote_statuses[player.name]
 
-            # 状態の更新
-            status.has_voted = var.get()
-            status.vote_time = datetime.now() if var.get() else None
+            # 状態が変わっていなければ通知しない
+            has_voted = var.get()
+            if has_voted == status.has_voted:
+                return
+
+            # 状態の更新（未投票者数は変化分のみ反映）
+            self.state.unvoted_count += -1 if has_voted else 1
+            status.has_voted = has_voted
+            status.vote_time = self._now() if has_voted else None
 
             self._update_remaining_votes()
 
@@ -194,7 +377,7 @@ class VoteManagerWindow:
                     type=EventType.VOTE_RECORDED,
                     data={
                         "player_name": player.name,
-                        "has_voted": var.get(),
+                        "has_voted": has_voted,
                         "phase": self.state.phase.value,
                         "round": self.state.round,
                     },
@@ -202,34 +385,43 @@ class VoteManagerWindow:
                 )
             )
 
-            self.logger.info(f"Vote status updated for {player.name}: {var.get()}")
+            self.logger.info(f"Vote status updated for {player.name}: {has_voted}")
 
         except Exception as e:
             self.logger.error(f"Error handling vote change: {str(e)}")
             self._show_error("投票状態の更新中にエラーが発生しました。")
 
+    def _now(self) -> datetime:
+        """現在時刻を取得（アイドル状態に戻るまでは同じ値を返す）"""
+        if self._cached_now is None:
+            self._cached_now = datetime.now()
+            self.window.after_idle(self._invalidate_now)
+        return self._cached_now
+
+    def _invalidate_now(self) -> None:
+        """キャッシュした現在時刻の破棄"""
+        self._cached_now = None
+
     def _update_remaining_votes(self) -> None:
         """未投票者数の更新"""
         try:
-            # 未投票者数の計算
-            remaining = sum(
-                1
-                for status in self.state.vote_statuses.values()
-                if not status.has_voted
-            )
-
-            # ラベルの更新
-            self.remaining_votes_label.config(text=f"未投票プレイヤー: {remaining}人")
+            remaining = self.state.unvoted_count
+
+            # ラベルの文字と色のうち、変わったものだけを1回の設定で更新
+            text = f"未投票プレイヤー: {remaining}人"
+            foreground = "green" if remaining == 0 else "black"
+            changes = {}
+            if text != self._last_label_text:
+                changes["text"] = self._last_label_text = text
+            if foreground != self._last_label_fg:
+                changes["foreground"] = self._last_label_fg = foreground
+            if changes:
+                self.remaining_votes_label.config(**changes)
 
             # 投票完了時の処理
             if remaining == 0 and not self.state.is_voting_complete:
                 self._handle_voting_complete()
 
-            # 色の更新
-            self.remaining_votes_label.config(
-                foreground="green" if remaining == 0 else "black"
-            )
-
         except Exception as e:
             self.logger.error(f"Error updating remaining votes: {str(e)}")
             self._show_error("未投票者数の更新中にエラーが発生しました。")
@@ -245,7 +437,7 @@ class VoteManagerWindow:
                     data={
                         "phase": self.state.phase.value,
                         "round": self.state.round,
-                        "vote_results": self._get_vote_summary(),
+                        "vote_results": _LazyVoteSummary(self.state.vote_statuses),
                     },
                     source="vote_manager",
                 )
@@ -257,30 +449,13 @@ class VoteManagerWindow:
             self.logger.error(f"Error handling voting completion: {str(e)}")
             self._show_error("投票完了処理中にエラーが発生しました。")
 
-    def _get_vote_summary(self) -> Dict:
-        """投票結果のサマリーを取得"""
-        return {
-            player_name: {
-                "vote_time": status.vote_time.isoformat() if status.vote_time else None,
-                "vote_target": status.vote_target,
-            }
-            for player_name, status in self.state.vote_statuses.items()
-        }
-
     def handle_event(self, event: GameEvent) -> None:
         """イベントハンドラ"""
         try:
-            handlers = {
-                EventType.PLAYER_DIED: self._handle_player_death,
-                EventType.PHASE_CHANGED: self._handle_phase_change,
-                EventType.GAME_STATE_UPDATED: self._handle_game_state_update,
-                EventType.ERROR: self._handle_error,
-            }
-
-            handler = handlers.get(event.type)
-            if handler:
-                handler(event)
-                self.state.last_update = datetime.now()
+            handler_name = self._EVENT_HANDLERS.get(event.type)
+            if handler_name:
+                getattr(self, handler_name)(event)
+                self.state.last_update = self._now()
 
         except Exception as e:
             self.logger.error(f"Error handling event {event.type}: {str(e)}")
@@ -327,15 +502,21 @@ class VoteManagerWindow:
     def _reset_votes(self) -> None:
         """投票状態のリセット"""
         try:
-            # 状態のリセット
-            for status in self.state.vote_statuses.values():
-                status.has_voted = False
-                status.vote_time = None
-                status.vote_target = None
-
-            # UI変数のリセット
-            for var in self.vote_vars.values():
-                var.set(False)
+            # 状態とUI変数をまとめてリセット（変更通知は発行しない）
+            self._suppress_vote_events = True
+            try:
+                for status in self.state.vote_statuses.values():
+                    status.has_voted = False
+                    status.vote_time = None
+                    status.vote_target = None
+
+                # チェック済みの変数だけを更新する
+                for var in self.vote_vars.values():
+                    if var.get():
+                        var.set(False)
+                self.state.unvoted_count = len(self.state.vote_statuses)
+            finally:
+                self._suppress_vote_events = False
 
             self.state.is_voting_complete = False
             self._update_remaining_votes()
@@ -361,25 +542,28 @@ class VoteManagerWindow:
             self.state.phase = game_state.current_phase
             self.state.round = game_state.current_round
 
-            # 生存プレイヤーリストの更新
-            current_players = {
-                name: player
-                for name, player in game_state.players.items()
-                if player.is_alive
-            }
+            # 生存者が前回から変わっていなければ投票状態はそのまま使える
+            alive_players = self._get_alive_players()
+            if self._statuses_key == self._alive_cache_key:
+                return
 
-            # 投票状態の更新
+            # 投票状態の更新（未投票者数も同じループで数える）
+            old_statuses = self.state.vote_statuses
             updated_statuses = {}
-            for name, player in current_players.items():
-                if name in self.state.vote_statuses:
-                    # 既存の投票状態を保持
-                    updated_statuses[name] = self.state.vote_statuses[name]
-                else:
+            unvoted_count = 0
+            for player in alive_players:
+                status = old_statuses.get(player.name)
+                if status is None:
                     # 新規プレイヤーの状態を作成
-                    updated_statuses[name] = VoteStatus(player=player)
+                    status = VoteStatus(player=player)
+                updated_statuses[player.name] = status
+                if not status.has_voted:
+                    unvoted_count += 1
 
             self.state.vote_statuses = updated_statuses
-            self._update_player_list()
+            self.state.unvoted_count = unvoted_count
+            self._statuses_key = self._alive_cache_key
+            self._schedule_redraw()
 
             self.logger.info("Synchronized with game state")
 
@@ -407,6 +591,11 @@ class VoteManagerWindow:
         """ウィンドウの破棄"""
         try:
             if hasattr(self, "window"):
+                if self._redraw_after_id is not None:
+                    self.window.after_cancel(self._redraw_after_id)
+                    self._redraw_after_id = None
+                if self._canvas is not None:
+                    self._unbind_mousewheel()
                 self.window.destroy()
                 event_manager.unsubscribe_all(self)
                 self.logger.info("Vote manager window destroyed")
@@ -1,16 +1,66 @@
 # Data validation utilities
 
 # validators.pyに必要な検証機能を追加
+from collections import Counter
+from collections.abc import Mapping
 from typing import Dict, Any, Optional
-from core.player import Player
+from core.player import Player, PlayerRole
 from core.game_state import GameState
 
 
 def validate_player_data(player: Player) -> bool:
-    # プレイヤーデータの検証
-    pass
+    # プレイヤーデータの検証（型と値の範囲を1回の式でまとめて確認）
+    number = player.number
+    name = player.name
+    role = player.role
+    return (
+        type(number) is int
+        and number >= 0
+        and type(name) is str
+        and bool(name.strip())
+        and (role is None or type(role) is PlayerRole)
+        and type(player.is_alive) is bool
+    )
 
 
 def validate_game_state(state: GameState) -> bool:
-    # ゲーム状態の検証
-    pass
+    # ゲーム状態の検証（プレイヤーを1回走査し、集計結果で整合性を確認）
+    players = state.players
+    numbers = set()
+    role_counts = Counter()
+    alive_count = 0
+    for name, player in players.items():
+        if player.name != name or not validate_player_data(player):
+            return False
+        numbers.add(player.number)
+        alive_count += player.is_alive
+        if player.role is not None:
+            role_counts[player.role.value] += 1
+
+    # プレイヤー番号の重複
+    if len(numbers) != len(players):
+        return False
+
+    # 生存者は登録済みかつ生存中のプレイヤーのみ
+    for name in state.alive_players:
+        player = players.get(name)
+        if player is None or not player.is_alive:
+            return False
+
+    if state.game_active:
+        # ゲーム中は生存中のプレイヤー全員が生存者リストに載っている
+        if len(state.alive_players) != alive_count:
+            return False
+
+        # 各役職の人数がレギュレーションの人数を超えない
+        regulation = state.regulation
+        if isinstance(regulation, Mapping):
+            regulation_roles = regulation.get("roles")
+        else:
+            regulation_roles = getattr(regulation, "roles", None)
+        if regulation_roles is not None and any(
+            count > regulation_roles.get(role, 0) for role, count in role_counts.items()
+        ):
+            return False
+
+    return True